@@ -1,10 +1,26 @@
-import os, logging, threading, time, re, json
+import eventlet
+eventlet.monkey_patch()  # Sheets API(httplib2) 소켓도 green socket으로 동작하도록
+
+import os, logging, re, json, hashlib, threading
 from datetime import datetime
 from dotenv import load_dotenv
+import numpy as np
 import pandas as pd
+import orjson
+from pandas.util import hash_pandas_object
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 JSON 이벤트만 전송
+    msgpack = None
+
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 str.extract 경로 사용
+    njit = None
 
-from flask import Flask, jsonify, request, send_from_directory
-from flask_socketio import SocketIO, emit, disconnect
+from flask import Flask, Response, request, send_from_directory
+from flask_socketio import SocketIO, emit, disconnect, join_room, leave_room
 
 from dashboard.utils.google_sheets import GoogleSheetsManager
 from dashboard.utils.data_analyzer import DataAnalyzer
@@ -15,9 +31,27 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("dashboard")
 
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY  # naive 시각은 그대로 (시트 값은 KST 기준)
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj, option=_ORJSON_OPTS, default=str)
+
+def ojsonify(obj) -> Response:
+    return Response(_dumps(obj), mimetype="application/json")
+
+class _OrjsonCodec:
+    """Socket.IO 패킷 인코더를 orjson으로 교체 (python-socketio json 인터페이스 호환)"""
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return _dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__, static_folder="static")
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "change-this")
-socketio = SocketIO(app, async_mode="eventlet", cors_allowed_origins="*")
+socketio = SocketIO(app, async_mode="eventlet", cors_allowed_origins="*", json=_OrjsonCodec)
 
 SHEET_ID = os.getenv("SHEET_ID")
 SHEET_RANGE = os.getenv("SHEET_RANGE", "공사 현황!A1:AM10000")
@@ -25,6 +59,7 @@ SERVICE_JSON = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
 OWNER_EMAIL_COLUMN = os.getenv("OWNER_EMAIL_COLUMN", "담당자 이메일")
 PROJECT_CODE_COLUMN = os.getenv("PROJECT_CODE_COLUMN", "프로젝트 코드")
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "10"))
+PROJECTS_ROOM = "projects"
 
 # load credentials.json
 try:
@@ -42,27 +77,117 @@ if not SHEET_RANGE or SHEET_RANGE == "공사 현황!A1:AM10000":
     SHEET_RANGE = _creds.get("sheet_range") or SHEET_RANGE
 if not os.getenv("SLACK_WEBHOOK_URL") and _creds.get("slack_webhook_url"):
     os.environ["SLACK_WEBHOOK_URL"] = _creds.get("slack_webhook_url","" )
+CREATED_DATE_COLUMN = os.getenv("CREATED_DATE_COLUMN", _creds.get("created_date_column", "등록일"))
 
 gs = GoogleSheetsManager(SHEET_ID, SHEET_RANGE, SERVICE_JSON)
 notifier = NotificationSystem()
 
 _cache_df = pd.DataFrame()
 _cache_hash = None
+_cache_rev = None
+_cache_row_hashes = np.empty(0, dtype=np.uint64)
+_cache_records = []
+_cache_records_json = b"[]"
+_cache_codes = None
+_cache_meta = {"companies": [], "owners": []}
+_cache_company_prefix_map = {}
+_cache_owner_suffix_map = {}
+# 다음 러닝 번호: 캐시 갱신 시 시트 최대값+1로 맞추고, 발급은 lock 안에서 증가
+_cache_next_num = 1
+_next_num_lock = threading.Lock()
+# 필터 키 컬럼의 SoA 캐시: name -> (정수 코드 배열, 카테고리 값 Index)
+_cache_columns = {}
 _clients = {}
 
-def _df_hash(df: pd.DataFrame) -> str:
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    if df is None or df.empty:
+        return np.empty(0, dtype=np.uint64)
+    return hash_pandas_object(df, index=False).to_numpy()
+
+def _df_hash(df: pd.DataFrame, row_hashes: np.ndarray = None) -> str:
     if df is None or df.empty:
         return "empty"
-    return str(hash(tuple(df.astype(str).fillna("").itertuples(index=False))))
+    if row_hashes is None:
+        row_hashes = _row_hashes(df)
+    # 스키마(shape/컬럼명)가 바뀌어도 해시가 달라지도록 함께 섞음
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(df.shape).encode())
+    h.update("\x1f".join(map(str, df.columns)).encode())
+    h.update(row_hashes.tobytes())
+    return h.hexdigest()
+
+def _set_cache(df: pd.DataFrame, h: str, row_hashes: np.ndarray = None):
+    """캐시 갱신 시점에 records 직렬화를 한 번만 수행"""
+    global _cache_df, _cache_hash, _cache_records, _cache_records_json, _cache_codes, _cache_row_hashes
+    _cache_row_hashes = row_hashes if row_hashes is not None else _row_hashes(df)
+    global _cache_meta, _cache_company_prefix_map, _cache_owner_suffix_map, _cache_columns
+    _cache_codes = _parse_codes(df)
+    _cache_columns = _build_filter_columns(df)
+    _cache_records = df.to_dict(orient="records")
+    _cache_records_json = _dumps(_cache_records)
+    _cache_df, _cache_hash = df, h
+    _cache_meta = _meta_options(df)
+    _cache_company_prefix_map = _build_company_prefix_map(df)
+    _cache_owner_suffix_map = _build_owner_suffix_map(df)
+    _sync_next_number(_next_running_number(df))
+
+def _sync_next_number(num: int):
+    """이미 발급했지만 아직 시트에 반영되지 않은 번호를 재사용하지 않도록 증가 방향으로만 갱신"""
+    global _cache_next_num
+    with _next_num_lock:
+        _cache_next_num = max(_cache_next_num, num)
+
+def _take_next_number() -> int:
+    global _cache_next_num
+    with _next_num_lock:
+        num = _cache_next_num
+        _cache_next_num += 1
+    return num
+
+def _records_for(df: pd.DataFrame):
+    return _cache_records if df is _cache_df else df.to_dict(orient="records")
+
+def _rows_response(df: pd.DataFrame) -> Response:
+    # 필터가 적용되지 않은 경우(캐시 프레임 그대로)는 미리 직렬화한 바이트 재사용
+    body = _cache_records_json if df is _cache_df else _dumps(df.to_dict(orient="records"))
+    return Response(b'{"rows":' + body + b'}', mimetype="application/json")
+
+def _encode(s: pd.Series):
+    cat = s.astype("category")
+    return cat.cat.codes.to_numpy(), cat.cat.categories
+
+def _build_filter_columns(df: pd.DataFrame):
+    """사용자/쿼리 필터에 쓰는 컬럼을 한 번만 정규화해 (codes, categories) 배열로 보관"""
+    cols = {}
+    if '담당자' in df.columns:
+        cols["owner"] = _encode(df['담당자'].astype(str).str.strip())
+    if OWNER_EMAIL_COLUMN in df.columns:
+        cols["email"] = _encode(df[OWNER_EMAIL_COLUMN].astype("string").str.lower())
+    if CREATED_DATE_COLUMN in df.columns:
+        cols["month"] = _encode(df[CREATED_DATE_COLUMN].astype(str).str.slice(0,7))
+    return cols
+
+def _code_equals(name: str, value: str) -> np.ndarray:
+    codes, categories = _cache_columns[name]
+    try:
+        code = categories.get_loc(value)
+    except KeyError:
+        return np.zeros(len(codes), dtype=bool)
+    return codes == code
 
 def _filter_df_for_user(df: pd.DataFrame, email: str, admin: bool) -> pd.DataFrame:
     if admin:
         return df
     alias_map = (_creds.get("user_alias_map") or {})
     owner_name = alias_map.get(email.lower(), alias_map.get(email, ""))
+    cached = df is _cache_df
     if owner_name and '담당자' in df.columns:
+        if cached and "owner" in _cache_columns:
+            return df.iloc[_code_equals("owner", owner_name)]
         return df[df['담당자'].astype(str).str.strip() == owner_name]
     if OWNER_EMAIL_COLUMN in df.columns:
+        if cached and "email" in _cache_columns:
+            return df.iloc[_code_equals("email", (email or "").lower())]
         return df[df[OWNER_EMAIL_COLUMN].str.lower() == (email or "").lower()]
     return df[df.index < 0]
 
@@ -70,11 +195,19 @@ def _apply_query_filters(df: pd.DataFrame, args) -> pd.DataFrame:
     out = df
     month = args.get("month", "").strip()
     manager = args.get("manager", "").strip()
-    created_col = os.getenv("CREATED_DATE_COLUMN", _creds.get("created_date_column", "등록일"))
+    created_col = CREATED_DATE_COLUMN
+    if out is _cache_df:
+        # 캐시 프레임이면 정수 코드 비교로 마스크를 합친 뒤 한 번만 슬라이스
+        mask = None
+        if month and "month" in _cache_columns:
+            mask, month = _code_equals("month", month), ""
+        if manager and "owner" in _cache_columns:
+            m = _code_equals("owner", manager)
+            mask, manager = (m if mask is None else mask & m), ""
+        if mask is not None:
+            out = out.iloc[mask]
     if month and created_col in out.columns:
-        out = out.copy()
-        out["__month"] = out[created_col].astype(str).str.slice(0,7)
-        out = out[out["__month"] == month].drop(columns=["__month"])
+        out = out.iloc[(out[created_col].astype(str).str.slice(0,7) == month).to_numpy()]
     if manager:
         if '담당자' in out.columns:
             out = out[out['담당자'].astype(str).str.strip() == manager]
@@ -82,83 +215,169 @@ def _apply_query_filters(df: pd.DataFrame, args) -> pd.DataFrame:
             out = out[out[OWNER_EMAIL_COLUMN].astype(str).str.contains(manager, case=False, na=False)]
     return out
 
+_RE_NUM = re.compile(r'[A-Z](\d{4})-')
+_RE_SUFFIX = re.compile(r'[A-Z]\d{4}-([A-Z]+)$')
+# prefix/번호는 접두부만 맞으면 추출, suffix는 코드 전체가 형식에 맞을 때만 추출
+_RE_CODE = re.compile(r'^([A-Z])(\d{4})-(?:([A-Z]+)$)?')
+
 def _extract_number(code: str):
-    m = re.match(r'[A-Z](\d{4})-', str(code))
+    m = _RE_NUM.match(str(code))
     return int(m.group(1)) if m else None
 
 def _suffix_from_code(code: str):
-    m = re.match(r'[A-Z]\d{4}-([A-Z]+)$', str(code))
+    m = _RE_SUFFIX.match(str(code))
     return m.group(1) if m else None
 
+if njit is not None:
+    @njit(cache=True)
+    def _scan_codes(buf, out_num, out_has_suffix):
+        """(N, W) uint8 코드 버퍼를 바이트 단위로 검사 — _RE_CODE와 동일한 규칙"""
+        n, w = buf.shape
+        for i in range(n):
+            out_num[i] = -1
+            out_has_suffix[i] = False
+            if w < 6 or buf[i, 0] < 65 or buf[i, 0] > 90 or buf[i, 5] != 45:
+                continue
+            num = 0
+            for k in range(1, 5):
+                d = buf[i, k]
+                if d < 48 or d > 57:
+                    num = -1
+                    break
+                num = num * 10 + (d - 48)
+            if num < 0:
+                continue
+            out_num[i] = num
+            j = 6
+            while j < w and buf[i, j] >= 65 and buf[i, j] <= 90:
+                j += 1
+            out_has_suffix[i] = j > 6 and (j == w or buf[i, j] == 0)
+else:
+    _scan_codes = None
+
+def _parse_codes(df: pd.DataFrame):
+    """프로젝트 코드 컬럼을 한 번의 벡터 패스로 prefix/num/suffix로 분해"""
+    if '프로젝트 코드' not in df.columns:
+        return None
+    codes = df['프로젝트 코드'].astype(str).str.strip()
+    if _scan_codes is None:
+        parsed = codes.str.extract(_RE_CODE)
+        parsed.columns = ['prefix', 'num', 'suffix']
+        parsed['num'] = pd.to_numeric(parsed['num'], errors='coerce')
+        return parsed
+    raw = np.char.encode(codes.to_numpy(dtype=str), 'utf-8')
+    buf = raw.view(np.uint8).reshape(len(raw), raw.dtype.itemsize)
+    num = np.empty(len(raw), dtype=np.int32)
+    has_suffix = np.empty(len(raw), dtype=np.bool_)
+    _scan_codes(buf, num, has_suffix)
+    valid = num >= 0
+    return pd.DataFrame({
+        'prefix': codes.str.slice(0, 1).where(valid),
+        'num': pd.Series(num, index=codes.index, dtype='float64').where(valid),
+        'suffix': codes.str.slice(6).where(has_suffix),
+    })
+
+def _codes_for(df: pd.DataFrame):
+    return _cache_codes if df is _cache_df and _cache_codes is not None else _parse_codes(df)
+
 def _build_company_prefix_map(df: pd.DataFrame):
     m = {}
-    if '프로젝트 코드' in df.columns and '사업자' in df.columns:
-        for _, row in df.iterrows():
-            code = str(row.get('프로젝트 코드',''))
-            comp = str(row.get('사업자','')).strip()
-            mm = re.match(r'([A-Z])\d{4}-', code)
-            if comp and mm and comp not in m:
-                m[comp] = mm.group(1)
+    codes = _codes_for(df)
+    if codes is not None and '사업자' in df.columns:
+        comp = df['사업자'].astype(str).str.strip()
+        ok = codes['prefix'].notna() & (comp != '')
+        pairs = pd.DataFrame({'c': comp[ok], 'p': codes['prefix'][ok]}).drop_duplicates('c')
+        m = dict(zip(pairs['c'], pairs['p']))
     for k,v in (_creds.get('company_prefix_map', {}) or {}).items():
         m.setdefault(k, v)
     return m
 
 def _build_owner_suffix_map(df: pd.DataFrame):
     m = {k:str(v).upper() for k,v in (_creds.get('owner_suffix_map', {}) or {}).items()}
-    if '프로젝트 코드' in df.columns and '담당자' in df.columns:
-        from collections import Counter, defaultdict
-        grouped = defaultdict(list)
-        for _, row in df.iterrows():
-            name = str(row.get('담당자','')).strip()
-            code = str(row.get('프로젝트 코드','')).strip()
-            suf = _suffix_from_code(code)
-            if name and suf:
-                grouped[name].append(suf)
-        for name, arr in grouped.items():
-            common = Counter(arr).most_common(1)[0][0]
+    codes = _codes_for(df)
+    if codes is not None and '담당자' in df.columns:
+        name = df['담당자'].astype(str).str.strip()
+        ok = codes['suffix'].notna() & (name != '')
+        pairs = pd.DataFrame({'n': name[ok], 's': codes['suffix'][ok]})
+        # 담당자별 최빈 suffix (동률이면 먼저 나온 값 — Counter.most_common과 동일)
+        counts = pairs.groupby(['n', 's'], sort=False).size()
+        mode = counts.sort_values(ascending=False, kind='stable').reset_index().drop_duplicates('n')
+        for name, common in zip(mode['n'], mode['s']):
             m.setdefault(name, common)
     return m
 
 def _next_running_number(df: pd.DataFrame):
-    nums = []
-    if '프로젝트 코드' in df.columns:
-        for c in df['프로젝트 코드'].astype(str):
-            n = _extract_number(c)
-            if n is not None:
-                nums.append(n)
-    return (max(nums) + 1) if nums else 1
+    codes = _codes_for(df)
+    if codes is None:
+        return 1
+    top = codes['num'].max()
+    return int(top) + 1 if pd.notna(top) else 1
+
+_EMPTY_OPTION_VALUES = ('', '-', '없음', 'N/A', 'n/a')
+
+def _unique_options(df: pd.DataFrame, col: str):
+    if col not in df.columns:
+        return []
+    s = df[col].astype(str).str.strip()
+    return sorted(s[~s.isin(_EMPTY_OPTION_VALUES)].unique().tolist())
+
+def _meta_options(df: pd.DataFrame):
+    return {"companies": _unique_options(df, "사업자"), "owners": _unique_options(df, "담당자")}
 
 def _auto_project_code(df: pd.DataFrame, company: str, owner: str) -> str:
-    comp_map = _build_company_prefix_map(df)
-    own_map = _build_owner_suffix_map(df)
+    if df is _cache_df:
+        comp_map, own_map = _cache_company_prefix_map, _cache_owner_suffix_map
+    else:
+        comp_map = _build_company_prefix_map(df)
+        own_map = _build_owner_suffix_map(df)
     prefix = comp_map.get(company.strip())
     suffix = own_map.get(owner.strip())
     if not prefix or not suffix:
         raise ValueError(f'코드 생성 실패: 회사/담당자 매핑을 확인하세요 (company={company}, owner={owner})')
-    num = _next_running_number(df)
+    num = _take_next_number() if df is _cache_df else _next_running_number(df)
     return f"{prefix}{num:04d}-{suffix}"
 
+def _poll_once():
+    global _cache_rev
+    # 파일 버전이 그대로면 전체 범위를 다시 받지 않음
+    rev = gs.fetch_revision_id()
+    if rev is not None and rev == _cache_rev:
+        return
+    df = gs.fetch_dataframe()
+    row_hashes = _row_hashes(df)
+    h = _df_hash(df, row_hashes)
+    _cache_rev = rev
+    if h == _cache_hash:
+        return
+    # 새로 추가되었거나 내용이 바뀐 행만 누락 검사 대상으로
+    changed = df[~np.isin(row_hashes, _cache_row_hashes)]
+    _set_cache(df, h, row_hashes)
+    logger.info(f"시트 변경 감지({len(changed)}행) → 구독자에게 전송")
+    analyzer = DataAnalyzer(changed)
+    missing = analyzer.missing_fields()
+    if missing:
+        notifier.notify_missing_fields(missing)
+    # 인증된 클라이언트는 모두 같은 room에 있으므로 payload는 한 번만 직렬화됨
+    payload = {"rows": _cache_records, "ts": datetime.now().isoformat()}
+    if msgpack is not None:
+        # 바이너리 프레임으로 전송 — 구버전 클라이언트를 위해 JSON 이벤트도 함께 보냄
+        packed = msgpack.packb(payload, use_bin_type=True, default=str)
+        socketio.start_background_task(
+            socketio.emit, "projects:update:bin", packed,
+            to=PROJECTS_ROOM, namespace="/",
+        )
+    socketio.start_background_task(
+        socketio.emit, "projects:update", payload,
+        to=PROJECTS_ROOM, namespace="/",
+    )
+
 def poller():
-    global _cache_df, _cache_hash
     while True:
         try:
-            df = gs.fetch_dataframe()
-            h = _df_hash(df)
-            if h != _cache_hash:
-                _cache_df, _cache_hash = df, h
-                logger.info("시트 변경 감지 → 구독자에게 전송")
-                analyzer = DataAnalyzer(df)
-                missing = analyzer.missing_fields()
-                if missing:
-                    notifier.notify_missing_fields(missing)
-                for sid in list(_clients.keys()):
-                    try:
-                        emit("projects:update", {"rows": df.to_dict(orient="records"), "ts": datetime.now().isoformat()}, to=sid)
-                    except Exception as e:
-                        logger.warning(f"emit failed: {e}")
+            _poll_once()
         except Exception as e:
             logger.exception(f"poller error: {e}")
-        time.sleep(POLL_INTERVAL)
+        socketio.sleep(POLL_INTERVAL)
 
 @app.route("/")
 def index():
@@ -173,87 +392,83 @@ def static_files(path):
 def list_projects():
     email, admin = get_user_from_headers(request.headers)
     if not email:
-        return jsonify({"error":"Unauthorized"}), 401
+        return ojsonify({"error":"Unauthorized"}), 401
     df = _cache_df if not _cache_df.empty else gs.fetch_dataframe()
     df = _apply_query_filters(df, request.args)
-    return jsonify({"rows": df.to_dict(orient="records")})
+    return _rows_response(df)
 
 # --- 목록: 정산 전용 (본인 담당만)
 @app.route("/api/settlement/projects", methods=["GET"])
 def list_projects_settlement():
     email, admin = get_user_from_headers(request.headers)
     if not email:
-        return jsonify({"error":"Unauthorized"}), 401
+        return ojsonify({"error":"Unauthorized"}), 401
     base_df = _cache_df if not _cache_df.empty else gs.fetch_dataframe()
     df = _filter_df_for_user(base_df, email, admin)
     df = _apply_query_filters(df, request.args)
-    return jsonify({"rows": df.to_dict(orient="records")})
+    return _rows_response(df)
 
 # --- 신규 행 추가(수동)
 @app.route("/api/projects", methods=["POST"])
 def add_project():
     email, admin = get_user_from_headers(request.headers)
     if not email:
-        return jsonify({"ok": False, "error":"Unauthorized"}), 401
+        return ojsonify({"ok": False, "error":"Unauthorized"}), 401
     payload = request.json or {}
     required = [x.strip() for x in (_creds.get("required_fields") or os.getenv("REQUIRED_FIELDS","" )).split(",") if x.strip()]
     misses = [c for c in required if c not in payload or str(payload.get(c,"")).strip()==""]
     if misses:
-        return jsonify({"ok": False, "error": f"누락 필드: {', '.join(misses)}"}), 400
+        return ojsonify({"ok": False, "error": f"누락 필드: {', '.join(misses)}"}), 400
     try:
         gs.append_row(payload)
-        return jsonify({"ok": True})
+        # 실제 시트 반영은 일괄 전송 후 다음 poll에서 확인됨
+        return ojsonify({"ok": True}), 202
     except Exception as e:
         logger.exception(e)
-        return jsonify({"ok": False, "error": str(e)}), 500
+        return ojsonify({"ok": False, "error": str(e)}), 500
 
 # --- 신규 행 추가(자동 코드 생성)
 @app.route("/api/projects/auto", methods=["POST"])
 def add_project_auto():
     email, admin = get_user_from_headers(request.headers)
     if not email:
-        return jsonify({"ok": False, "error":"Unauthorized"}), 401
+        return ojsonify({"ok": False, "error":"Unauthorized"}), 401
     payload = request.json or {}
     company = str(payload.get("사업자","" )).strip()
     owner = str(payload.get("담당자","" )).strip()
     if not company or not owner:
-        return jsonify({"ok": False, "error": "사업자/담당자는 필수"}), 400
+        return ojsonify({"ok": False, "error": "사업자/담당자는 필수"}), 400
+
+    # 필수 필드 검증 — 번호를 발급하기 전에 (프로젝트 코드는 아래에서 생성)
+    required = [x.strip() for x in (_creds.get("required_fields") or os.getenv("REQUIRED_FIELDS","" )).split(",") if x.strip()]
+    misses = [c for c in required if c != "프로젝트 코드" and (c not in payload or str(payload.get(c,"")).strip()=="")]
+    if misses:
+        return ojsonify({"ok": False, "error": f"누락 필드: {', '.join(misses)}"}), 400
 
     # 코드 생성
     df = _cache_df if not _cache_df.empty else gs.fetch_dataframe()
     try:
         code = _auto_project_code(df, company, owner)
     except Exception as e:
-        return jsonify({"ok": False, "error": str(e)}), 400
+        return ojsonify({"ok": False, "error": str(e)}), 400
     payload["프로젝트 코드"] = code
 
-    # 필수 필드 검증
-    required = [x.strip() for x in (_creds.get("required_fields") or os.getenv("REQUIRED_FIELDS","" )).split(",") if x.strip()]
-    misses = [c for c in required if c not in payload or str(payload.get(c,"")).strip()==""]
-    if misses:
-        return jsonify({"ok": False, "error": f"누락 필드: {', '.join(misses)}"}), 400
-
     try:
         gs.append_row(payload)
-        return jsonify({"ok": True, "project_code": code})
+        return ojsonify({"ok": True, "project_code": code}), 202
     except Exception as e:
         logger.exception(e)
-        return jsonify({"ok": False, "error": str(e)}), 500
+        return ojsonify({"ok": False, "error": str(e)}), 500
 
 # --- 드롭다운 옵션: 사업자/담당자 자동 추출
 @app.route("/api/meta/options", methods=["GET"])
 def meta_options():
     email, admin = get_user_from_headers(request.headers)
     if not email:
-        return jsonify({"error":"Unauthorized"}), 401
-    df = _cache_df if not _cache_df.empty else gs.fetch_dataframe()
-    companies = []
-    owners = []
-    if "사업자" in df.columns:
-        companies = sorted(set(x.strip() for x in df["사업자"].astype(str) if x.strip() and x.strip() not in ("-", "없음", "N/A", "n/a")))
-    if "담당자" in df.columns:
-        owners = sorted(set(x.strip() for x in df["담당자"].astype(str) if x.strip() and x.strip() not in ("-", "없음", "N/A", "n/a")))
-    return jsonify({"companies": companies, "owners": owners})
+        return ojsonify({"error":"Unauthorized"}), 401
+    if not _cache_df.empty:
+        return ojsonify(_cache_meta)
+    return ojsonify(_meta_options(gs.fetch_dataframe()))
 
 @socketio.on("auth")
 def sock_auth(data):
@@ -266,10 +481,13 @@ def sock_auth(data):
         disconnect()
         return
     _clients[request.sid] = {"email": email, "admin": admin}
+    join_room(PROJECTS_ROOM)
 
 @socketio.on("disconnect")
 def sock_disconn():
-    _clients.pop(request.sid, None)
+    ctx = _clients.pop(request.sid, None)
+    if ctx:
+        leave_room(PROJECTS_ROOM)
 
 @socketio.on("projects:subscribe")
 def sock_subscribe(data):
@@ -280,15 +498,14 @@ def sock_subscribe(data):
         disconnect()
         return
     df = _cache_df if not _cache_df.empty else gs.fetch_dataframe()
-    emit("projects:update", {"rows": df.to_dict(orient="records"), "ts": datetime.now().isoformat()})
+    emit("projects:update", {"rows": _records_for(df), "ts": datetime.now().isoformat()})
 
 def boot():
-    global _cache_df, _cache_hash
+    global _cache_rev
+    _cache_rev = gs.fetch_revision_id()
     df = gs.fetch_dataframe()
-    _cache_df = df
-    _cache_hash = _df_hash(df)
-    th = threading.Thread(target=poller, daemon=True)
-    th.start()
+    _set_cache(df, _df_hash(df))
+    socketio.start_background_task(poller)
 
 if __name__ == "__main__":
     boot()
@@ -28,7 +28,13 @@
     socket.emit('auth', {apiKey, userEmail});
     socket.emit('projects:subscribe', {filters: {}});
   });
-  socket.on('projects:update', payload=>{ render(payload.rows); });
+  // MessagePack 디코더가 있으면 바이너리 이벤트만 사용, 없으면 JSON 이벤트로 폴백
+  const msgpack = window.MessagePack;
+  if(msgpack){
+    socket.on('projects:update:bin', buf=>{ render(msgpack.decode(new Uint8Array(buf)).rows); });
+  }else{
+    socket.on('projects:update', payload=>{ render(payload.rows); });
+  }
 
   document.getElementById('refresh').addEventListener('click', async ()=>{
     const month = monthEl.value.trim();
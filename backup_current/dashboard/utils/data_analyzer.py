@@ -1,5 +1,6 @@
 import os
 from typing import List, Dict, Any
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -19,7 +20,8 @@ def _parse_date(s: str):
 
 class DataAnalyzer:
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+        # 읽기 전용으로만 사용하므로 캐시 프레임을 복사하지 않음
+        self.df = df
         self.required_fields = [x.strip() for x in os.getenv("REQUIRED_FIELDS", "").split(",") if x.strip()]
         self.confirm_col = os.getenv("CONFIRM_COLUMN", "공사 확정")
         self.deposit_date_col = os.getenv("DEPOSIT_DATE_COLUMN", "계약금 입금일")
@@ -30,14 +32,22 @@ class DataAnalyzer:
     def missing_fields(self) -> List[Dict[str, Any]]:
         if not self.required_fields:
             return []
-        out: List[Dict[str, Any]] = []
-        for _, row in self.df.iterrows():
-            miss = []
-            for col in self.required_fields:
-                if col not in self.df.columns or str(row.get(col, "")).strip() == "":
-                    miss.append(col)
-            if miss:
-                d = row.to_dict()
-                d["_missing_fields"] = miss
-                out.append(d)
+        df = self.df
+        cols = self.required_fields
+        # (N, K) 빈 칸 마스크 — 시트에 없는 컬럼은 전부 누락으로 처리
+        empty = np.ones((len(df), len(cols)), dtype=bool)
+        for j, col in enumerate(cols):
+            if col in df.columns:
+                empty[:, j] = (df[col].astype(str).str.strip() == "").to_numpy()
+        rows = np.flatnonzero(empty.any(axis=1))
+        if not len(rows):
+            return []
+        # 누락 컬럼명 목록도 행 단위 루프 없이 (row, col) 인덱스에서 한 번에 잘라냄
+        hit = empty[rows]
+        _, col_idx = np.nonzero(hit)
+        names = np.asarray(cols, dtype=object)[col_idx]
+        per_row = np.split(names, np.cumsum(hit.sum(axis=1))[:-1])
+        out: List[Dict[str, Any]] = df.iloc[rows].to_dict("records")
+        for d, miss in zip(out, per_row):
+            d["_missing_fields"] = miss.tolist()
         return out
@@ -1,35 +1,94 @@
 import logging
+import threading
 from typing import Dict, List, Optional
+import httplib2
 import pandas as pd
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 
 logger = logging.getLogger(__name__)
 
+HTTP_TIMEOUT = 30
+APPEND_DEBOUNCE_SECONDS = 0.2
+
+# 일괄 추가 재시도 대상 (충돌/일시적 서버 오류, 응답 없는 연결 오류 포함)
+RETRY_STATUSES = {409, 429, 500, 502, 503, 504}
+MAX_APPEND_RETRIES = 6
+# 요청이 반영되지 않은 것이 확실한 상태 - 그 외(5xx, 응답 없는 연결 오류)는 이미 추가됐을 수 있음
+NOT_APPLIED_STATUSES = {429}
+CODE_HEADER = "프로젝트 코드"
+
+# 서비스 계정 파일별로 인증된 HTTP 클라이언트를 하나만 두고 재사용 (keep-alive 연결/토큰 공유)
+_AUTHORIZED_HTTP: Dict[str, AuthorizedHttp] = {}
+
+def _authorized_http(service_account_json: str, scopes: List[str]) -> AuthorizedHttp:
+    http = _AUTHORIZED_HTTP.get(service_account_json)
+    if http is None:
+        creds = Credentials.from_service_account_file(service_account_json, scopes=scopes)
+        http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        _AUTHORIZED_HTTP[service_account_json] = http
+    return http
+
+def _column_letter(idx: int) -> str:
+    """0부터 시작하는 열 위치 -> A1 표기 열 문자"""
+    letters = ""
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
 class GoogleSheetsManager:
     SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+    DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.metadata.readonly"]
 
     def __init__(self, sheet_id: str, range_a1: str, service_account_json: str):
         self.sheet_id = sheet_id
         self.range_a1 = range_a1
         self.service_account_json = service_account_json
+        self._drive = None
         self._service = self._build_service()
         self._headers: List[str] = []
         self._last_df: Optional[pd.DataFrame] = None
+        self._pending: List[List[str]] = []
+        self._append_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_attempt = 0
+        self._failed_count = 0  # 마지막 실패 시 대기열 앞에 되돌린 행 수
 
     def _build_service(self):
         if not self.service_account_json:
             logger.warning("Google API 키가 설정되지 않았습니다. 더미 모드로 실행됩니다.")
             return None
         try:
-            creds = Credentials.from_service_account_file(
-                self.service_account_json, scopes=self.SCOPES
-            )
-            return build("sheets", "v4", credentials=creds, cache_discovery=False)
+            http = _authorized_http(self.service_account_json, self.SCOPES + self.DRIVE_SCOPES)
+            # static_discovery: 번들된 discovery 문서를 사용해 시작 시 네트워크 요청 생략
+            self._drive = build("drive", "v3", http=http, cache_discovery=False, static_discovery=True)
+            return build("sheets", "v4", http=http, cache_discovery=False, static_discovery=True)
         except Exception as e:
             logger.warning(f"Google Sheets 연결 실패: {e}. 더미 모드로 실행됩니다.")
             return None
 
+    def fetch_revision_id(self) -> Optional[str]:
+        """시트 파일 버전만 가볍게 조회 (조회 불가 시 None → 호출측은 전체 fetch)"""
+        if not self._drive:
+            return None
+        try:
+            meta = self._drive.files().get(
+                fileId=self.sheet_id, fields="version,modifiedTime"
+            ).execute()
+            return meta.get("version") or meta.get("modifiedTime")
+        except Exception as e:
+            status = getattr(getattr(e, "resp", None), "status", None)
+            if status in (401, 403):
+                # Drive 권한이 없으면 매 poll마다 실패하므로 한 번만 기록하고 버전 조회를 끔
+                self._drive = False
+                logger.warning(f"Drive 권한 없음({status}), 시트 버전 조회 비활성화: {e}")
+            else:
+                logger.warning(f"시트 버전 조회 실패: {e}")
+            return None
+
     def fetch_dataframe(self) -> pd.DataFrame:
         if not self._service:
             # 더미 데이터 반환
@@ -46,7 +105,8 @@ class GoogleSheetsManager:
             return df
             
         values = self._service.spreadsheets().values().get(
-            spreadsheetId=self.sheet_id, range=self.range_a1
+            spreadsheetId=self.sheet_id, range=self.range_a1,
+            majorDimension="ROWS", fields="values",
         ).execute().get("values", [])
 
         if not values:
@@ -66,10 +126,106 @@ class GoogleSheetsManager:
         if not self._headers:
             self.fetch_dataframe()
         row = [record.get(h, "") for h in self._headers]
-        self._service.spreadsheets().values().append(
-            spreadsheetId=self.sheet_id,
-            range=self.range_a1.split("!")[0],
-            valueInputOption="USER_ENTERED",
-            insertDataOption="INSERT_ROWS",
-            body={"values": [row]},
-        ).execute()
+        # 짧은 시간 안에 들어온 추가 요청은 모아서 한 번의 append 호출로 전송
+        with self._append_lock:
+            self._pending.append(row)
+            self._arm_flush(APPEND_DEBOUNCE_SECONDS)
+
+    def _arm_flush(self, delay: float) -> None:
+        """_append_lock을 잡은 상태에서 호출 - 예약된 flush가 없으면 delay 후 실행 예약"""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self._flush_pending)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush_appends(self) -> int:
+        """대기 중인 행을 한 번의 values.append로 전송하고 전송한 행 수를 반환"""
+        with self._append_lock:
+            rows, self._pending = self._pending, []
+            self._flush_timer = None
+        if not rows:
+            return 0
+        try:
+            self._service.spreadsheets().values().append(
+                spreadsheetId=self.sheet_id,
+                range=self.range_a1.split("!")[0],
+                valueInputOption="USER_ENTERED",
+                insertDataOption="INSERT_ROWS",
+                body={"values": rows},
+            ).execute()
+        except Exception:
+            # 이미 202로 접수 응답한 행이므로 버리지 않고 대기열 앞에 되돌림 (순서 유지)
+            # 실패 처리(반영 여부 확인)가 끝날 때까지 새 flush가 예약되지 않도록 막아 둠
+            with self._append_lock:
+                self._pending[:0] = rows
+                self._failed_count = len(rows)
+                if self._flush_timer:
+                    self._flush_timer.cancel()
+                self._flush_timer = False
+            raise
+        return len(rows)
+
+    def _already_appended(self, rows: List[List[str]]) -> Optional[List[bool]]:
+        """응답을 받지 못한 묶음의 각 행이 이미 시트에 들어갔는지 프로젝트 코드로 확인
+        (코드 열이 없거나 코드가 빈 행이 있거나 조회에 실패하면 확인 불가 → None)"""
+        if CODE_HEADER not in self._headers:
+            return None
+        idx = self._headers.index(CODE_HEADER)
+        codes = [str(r[idx]).strip() if idx < len(r) else "" for r in rows]
+        if not all(codes):
+            return None
+        col = _column_letter(idx)
+        try:
+            values = self._service.spreadsheets().values().get(
+                spreadsheetId=self.sheet_id,
+                range=f"{self.range_a1.split('!')[0]}!{col}:{col}",
+                majorDimension="COLUMNS", fields="values",
+            ).execute().get("values", [[]])
+        except Exception as e:
+            logger.error(f"일괄 추가 반영 여부 확인 실패: {e}")
+            return None
+        existing = set(values[0]) if values else set()
+        return [c in existing for c in codes]
+
+    def _flush_pending(self):
+        try:
+            n = self.flush_appends()
+            self._flush_attempt = 0
+            logger.info(f"시트에 {n}행 일괄 추가")
+        except Exception as e:
+            status = getattr(getattr(e, "resp", None), "status", None)
+            retryable = (status is None or status in RETRY_STATUSES) and self._flush_attempt < MAX_APPEND_RETRIES
+            applied = None
+            if retryable and status not in NOT_APPLIED_STATUSES:
+                # 응답만 잃었을 수 있으므로 다시 보내기 전에 이미 들어간 행을 확인 (확인 불가면 중복 방지를 위해 재전송 안 함)
+                with self._append_lock:
+                    failed = self._pending[:self._failed_count]
+                applied = self._already_appended(failed)
+                retryable = applied is not None
+            with self._append_lock:
+                self._flush_timer = None
+                if applied:
+                    kept = [r for r, done in zip(self._pending[:self._failed_count], applied) if not done]
+                    self._pending[:self._failed_count] = kept
+                    self._failed_count = len(kept)
+                    if applied.count(True):
+                        logger.warning(f"응답 실패한 일괄 추가 중 {applied.count(True)}행은 이미 반영되어 재전송에서 제외")
+                    if not kept:
+                        self._flush_attempt = 0
+                        if self._pending:
+                            self._arm_flush(APPEND_DEBOUNCE_SECONDS)
+                        return
+                if retryable and self._flush_attempt < MAX_APPEND_RETRIES:
+                    delay = APPEND_DEBOUNCE_SECONDS * (2 ** (self._flush_attempt + 1))  # 지수 백오프
+                    self._flush_attempt += 1
+                    logger.warning(f"시트 행 일괄 추가 재시도 예정 ({status}, {delay:.1f}초 후, "
+                                   f"시도 {self._flush_attempt}/{MAX_APPEND_RETRIES}): {e}")
+                    self._arm_flush(delay)
+                    return
+                # 재시도 불가 - 실패한 묶음만 빼고 내용을 로그에 남겨 수동 복구할 수 있게 함
+                rows = self._pending[:self._failed_count]
+                del self._pending[:self._failed_count]
+                self._flush_attempt = 0
+                if self._pending:
+                    self._arm_flush(APPEND_DEBOUNCE_SECONDS)  # 그 사이 들어온 행은 따로 전송
+            logger.error(f"시트 행 일괄 추가 실패, {len(rows)}행 미반영: {e} / rows={rows}")
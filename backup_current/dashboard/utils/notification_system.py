@@ -1,4 +1,5 @@
 import os, time, logging, requests
+from collections import OrderedDict
 from typing import List, Dict
 logger = logging.getLogger(__name__)
 
@@ -6,15 +7,25 @@ class NotificationSystem:
     def __init__(self):
         self.slack_webhook = os.getenv("SLACK_WEBHOOK_URL", "").strip()
         self.suppress_minutes = int(os.getenv("NOTIFY_SUPPRESS_MINUTES", "120"))
-        self._recent: Dict[str, float] = {}
+        # key -> 마지막 발송 시각(monotonic). 발송 순서대로 유지되므로 앞쪽이 가장 오래된 항목
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._max_recent = int(os.getenv("NOTIFY_SUPPRESS_MAX_KEYS", "4096"))
 
     def _should_send(self, key: str) -> bool:
-        now = time.time()
-        last = self._recent.get(key, 0)
-        if now - last >= self.suppress_minutes * 60:
-            self._recent[key] = now
-            return True
-        return False
+        now = time.monotonic()
+        window = self.suppress_minutes * 60
+        last = self._recent.get(key)
+        if last is not None and now - last < window:
+            return False
+        self._recent[key] = now
+        self._recent.move_to_end(key)
+        # 만료됐거나 용량을 넘은 항목은 앞에서부터 제거 (항목당 O(1))
+        while self._recent:
+            oldest = next(iter(self._recent.values()))
+            if now - oldest < window and len(self._recent) <= self._max_recent:
+                break
+            self._recent.popitem(last=False)
+        return True
 
     def _post_slack(self, text: str):
         if not self.slack_webhook:
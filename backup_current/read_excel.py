@@ -1,34 +1,49 @@
-import openpyxl
 import sys
 
+EXCEL_PATH = 'data/아이티 공사 현황.xlsx'
+PREVIEW_ROWS = 5
+
+def read_preview(path, nrows):
+    """(시트명 목록, 앞부분 행, 총 행 수, 총 열 수) 반환 - calamine(Rust) 우선, 없으면 openpyxl read-only"""
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(path)
+        ws = wb.get_sheet_by_index(0)
+        return wb.sheet_names, ws.to_python(nrows=nrows), ws.height, ws.width
+
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        ws = wb.active
+        rows = list(ws.iter_rows(max_row=nrows, values_only=True))
+        return wb.sheetnames, rows, ws.max_row, ws.max_column
+    finally:
+        wb.close()
+
 # 엑셀 파일 읽기
 try:
-    wb = openpyxl.load_workbook('data/아이티 공사 현황.xlsx')
-    ws = wb.active
-    
-    print("시트명:", wb.sheetnames)
-    print("데이터 범위:", ws.calculate_dimension())
+    sheet_names, rows, total_rows, total_cols = read_preview(EXCEL_PATH, PREVIEW_ROWS)
+
+    print("시트명:", sheet_names)
+    print(f"데이터 범위: {total_rows}행 x {total_cols}열")
     print()
-    
+
     print("첫 번째 행 (헤더):")
-    header_row = []
-    for cell in ws[1]:
-        if cell.value:
-            header_row.append(str(cell.value))
-        else:
-            header_row.append("")
+    header_row = [str(value) if value else "" for value in (rows[0] if rows else [])]
     print("\t".join(header_row))
     print()
-    
+
     print("처음 5행의 데이터:")
-    for i, row in enumerate(ws.iter_rows(values_only=True), 1):
+    for i, row in enumerate(rows, 1):
         row_data = [str(cell) if cell is not None else "" for cell in row]
         print(f"{i}행: {' | '.join(row_data)}")
-        if i >= 5:
-            break
-            
-    print(f"\n총 행 수: {ws.max_row}")
-    print(f"총 열 수: {ws.max_column}")
-    
+
+    print(f"\n총 행 수: {total_rows}")
+    print(f"총 열 수: {total_cols}")
+
 except Exception as e:
-    print(f"오류 발생: {e}")
\ No newline at end of file
+    print(f"오류 발생: {e}")
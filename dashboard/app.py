@@ -1,30 +1,71 @@
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, render_template, jsonify, request, send_from_directory, g
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_socketio import SocketIO, emit
 import os
 import sys
 import logging
 from datetime import datetime, timedelta
+from functools import wraps
 import json
+import hashlib
 import re
-from collections import Counter, defaultdict
+import queue
+import string
+import threading
+from types import MappingProxyType
+import orjson
+import pandas as pd
 from dotenv import load_dotenv
 
 # 프로젝트 루트 경로를 시스템 경로에 추가
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.dirname(project_root))
 
-from dashboard.utils.google_sheets import GoogleSheetsManager
+from dashboard.utils.google_sheets import GoogleSheetsManager, invalidate_sheet_cache
 from dashboard.utils.data_analyzer import DataAnalyzer
 
 # 환경 변수 로드
 load_dotenv()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify 직렬화를 orjson(C)으로 처리 - numpy 타입도 별도 변환 없이 직렬화"""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+    @staticmethod
+    def _orjson_default(o):
+        if o is pd.NaT or o is pd.NA:
+            return None
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self._orjson_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self._orjson_default, option=self.option),
+            mimetype=self.mimetype,
+        )
+
 # Flask 앱 초기화
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'your-secret-key-here')
 
+# 조회 API 응답 캐시 (데이터 변경 시 load_data/_apply_local_change에서 비움)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 60})
+
+def _cacheable(rv):
+    """오류 응답((body, status) 튜플)은 캐시하지 않음"""
+    return not isinstance(rv, tuple)
+
 # SocketIO 초기화 (실시간 업데이트용)
-socketio = SocketIO(app, cors_allowed_origins="*")
+# SOCKETIO_ASYNC_MODE=gevent/eventlet이면 해당 서버로 동작 (미지정 시 설치된 것 자동 선택)
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=os.getenv('SOCKETIO_ASYNC_MODE') or None)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -33,25 +74,113 @@ logger = logging.getLogger(__name__)
 # 전역 변수 (캐싱 개선)
 current_data = None
 last_update = None
-_data_cache = {}
-_cache_expiry = 60   # 1분 캐시
+_data_version = 0   # current_data가 다른 객체로 바뀔 때만 증가 (ETag 기준)
+_cache_expiry = 60   # current_data 유효 시간(초), 주기적 갱신 간격 기준
+_load_lock = threading.Lock()  # 동시 재로드 방지
+_code_cache = {}     # 코드 생성용 파생 데이터 (load_data()에서 무효화)
+_options_cache = {}  # 드롭다운 옵션 (df별)
+_index_cache = {}    # 프로젝트 코드 -> 행 위치 (df별)
+_analyzer = None     # current_data에 대한 DataAnalyzer (df가 바뀌면 새로 생성)
+_data_from_sheet = False  # current_data 인덱스가 시트 행(= 행 번호 - 2)과 일치하는지 (엑셀 폴백이면 False)
+_row_hints = {}      # 다음 로드 전까지의 코드 -> 시트 행 보정 (A열 검색 결과, 코드 변경 시 None = 인덱스 무효)
+# 인덱스로 계산한 행 번호를 A열 값으로 확인 (시트가 외부에서 편집될 수 있으므로 기본 확인, 단독 편집일 때만 false로 생략)
+_VERIFY_SHEET_ROW = os.getenv('VERIFY_SHEET_ROW', 'true').lower() != 'false'
+# 여러 프로세스가 같은 시트에 등록할 때 추가 직후 코드 중복 확인 (단일 프로세스면 false로 꺼도 됨)
+_VERIFY_APPEND_CODE = os.getenv('VERIFY_APPEND_CODE', 'true').lower() == 'true'
 
 # 프로젝트 설정 로드
+_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'project_config.json')
+_config_mtime = None
+
 def _load_project_config():
-    """project_config.json에서 설정 로드"""
+    """project_config.json에서 설정 로드 (읽기 전용 매핑)"""
+    global _config_mtime
     try:
-        config_path = os.path.join(os.path.dirname(__file__), 'project_config.json')
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        _config_mtime = os.stat(_CONFIG_PATH).st_mtime
+        with open(_CONFIG_PATH, 'r', encoding='utf-8') as f:
+            return MappingProxyType(json.load(f))
     except Exception as e:
         logger.warning(f"프로젝트 설정 로드 실패: {e}")
-        return {}
+        return MappingProxyType({})
+
+def _maybe_reload_config():
+    """설정 파일 mtime이 바뀐 경우에만 다시 파싱"""
+    global _project_config
+    try:
+        mtime = os.stat(_CONFIG_PATH).st_mtime
+    except OSError:
+        return
+    if mtime != _config_mtime:
+        _project_config = _load_project_config()
+        _apply_project_config(_project_config)
+        _code_cache.clear()
+        _options_cache.clear()
+        logger.info("프로젝트 설정 변경 감지 → 다시 로드")
+
+def _apply_project_config(cfg):
+    """요청마다 쓰는 설정 값을 정규화된 읽기 전용 상수로 풀어둠"""
+    global _REQUIRED_FIELDS, _CFG_COMPANY_PREFIX, _CFG_OWNER_SUFFIX, _CFG_COMPANIES, _CFG_OWNERS
+    _REQUIRED_FIELDS = tuple(cfg.get("required_fields", ["프로젝트 코드", "현장 주소"]))
+    _CFG_COMPANY_PREFIX = MappingProxyType({k: str(v) for k, v in cfg.get('company_prefix_map', {}).items()})
+    _CFG_OWNER_SUFFIX = MappingProxyType({k: str(v).upper() for k, v in cfg.get('owner_suffix_map', {}).items()})
+    _CFG_COMPANIES = frozenset(_CFG_COMPANY_PREFIX)
+    _CFG_OWNERS = frozenset(_CFG_OWNER_SUFFIX)
 
 _project_config = _load_project_config()
+_apply_project_config(_project_config)
+
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'  # 설치되어 있으면 Rust 파서로 엑셀 읽기
+except ImportError:
+    _EXCEL_ENGINE = None
+
+def _read_excel_cached(excel_path, sheet_name):
+    """엑셀 폴백 읽기 - 엑셀보다 최신인 parquet 캐시가 있으면 그것을 사용"""
+    cache_path = excel_path + '.parquet'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.warning(f"parquet 캐시 읽기 실패, 엑셀로 대체: {e}")
+    
+    df = pd.read_excel(excel_path, sheet_name=sheet_name, engine=_EXCEL_ENGINE)
+    try:
+        df.to_parquet(cache_path)
+    except Exception as e:
+        logger.warning(f"parquet 캐시 저장 실패: {e}")
+    return df
+
+# 인증/서비스 객체를 만든 GoogleSheetsManager 재사용 풀
+# (httplib2 연결은 스레드 간 공유가 안 되므로 한 번에 한 요청만 빌려 씀)
+_sheets_pool = queue.SimpleQueue()
+
+def _acquire_sheets_manager():
+    try:
+        return _sheets_pool.get_nowait()
+    except queue.Empty:
+        return GoogleSheetsManager()
+
+def _release_sheets_manager(manager):
+    _sheets_pool.put(manager)
+
+def get_sheets_manager():
+    """요청 동안 쓸 GoogleSheetsManager (요청이 끝나면 풀로 반환)"""
+    if 'sheets_manager' not in g:
+        g.sheets_manager = _acquire_sheets_manager()
+    return g.sheets_manager
+
+@app.teardown_appcontext
+def _return_sheets_manager(exc):
+    manager = g.pop('sheets_manager', None)
+    if manager is not None:
+        _release_sheets_manager(manager)
 
 def load_data():
     """구글 시트에서 데이터 로드"""
-    global current_data, last_update
+    global current_data, last_update, _data_from_sheet, _data_version
+    _code_cache.clear()
+    _maybe_reload_config()
     
     try:
         sheet_id = os.getenv('GOOGLE_SHEET_ID')
@@ -59,16 +188,26 @@ def load_data():
             logger.error("GOOGLE_SHEET_ID가 설정되지 않았습니다.")
             return None
         
-        # 구글 시트에서 데이터 가져오기
-        manager = GoogleSheetsManager()
-        df = manager.get_sheet_data(sheet_id)
+        # 구글 시트에서 데이터 가져오기 (백그라운드에서도 호출되므로 요청 컨텍스트 없이 직접 빌려 씀)
+        manager = _acquire_sheets_manager()
+        try:
+            df = manager.get_sheet_data(sheet_id)
+        finally:
+            _release_sheets_manager(manager)
         
         if df.empty:
             logger.warning("구글 시트에서 데이터를 가져올 수 없습니다.")
             return None
         
+        if df is not current_data:
+            _data_version += 1
         current_data = df
+        _data_from_sheet = True
+        _row_hints.clear()
         last_update = datetime.now()
+        cache.clear()
+        # 드롭다운 옵션은 로드 시점에 미리 계산 (요청 시에는 캐시만 반환)
+        _get_cached_options(df)
         
         logger.info(f"데이터 로드 완료: {len(df)}행, 업데이트 시간: {last_update}")
         return df
@@ -78,43 +217,79 @@ def load_data():
         
         # 로컬 엑셀 파일로 폴백
         try:
-            import pandas as pd
             excel_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', '아이티 공사 현황 (2).xlsx')
-            df = pd.read_excel(excel_path, sheet_name='공사 현황')
+            df = _read_excel_cached(excel_path, '공사 현황')
+            if df is not current_data:
+                _data_version += 1
             current_data = df
+            _data_from_sheet = False
             last_update = datetime.now()
+            cache.clear()
+            _get_cached_options(df)
             logger.info(f"로컬 파일에서 데이터 로드: {len(df)}행")
             return df
         except Exception as e2:
             logger.error(f"로컬 파일 로드도 실패: {str(e2)}")
             return None
 
-# 프로젝트 코드 자동 생성 함수들
-def _extract_number(code: str):
-    """프로젝트 코드에서 숫자 부분 추출"""
-    m = re.match(r'[A-Z](\d{4})-', str(code))
-    return int(m.group(1)) if m else None
+def get_current_data():
+    """TTL 이내면 current_data를 그대로 사용하고, 만료 시에만 재로드
+    (다른 요청이 이미 로드 중이면 기존 데이터를 반환)"""
+    if current_data is not None and last_update and \
+       (datetime.now() - last_update).total_seconds() < _cache_expiry:
+        return current_data
+    if not _load_lock.acquire(blocking=current_data is None):
+        return current_data
+    try:
+        df = load_data()
+    finally:
+        _load_lock.release()
+    return df if df is not None else current_data
+
+def _periodic_refresh():
+    """TTL 만료 전에 백그라운드에서 데이터를 미리 갱신"""
+    while True:
+        socketio.sleep(max(_cache_expiry - 5, 5))
+        with _load_lock:
+            load_data()
+
+def _reload_data():
+    """쓰기 직후 백그라운드 재로드 - 다른 재로드와 겹쳐 이전 스냅샷이 나중에 반영되지 않도록 _load_lock 아래에서 실행"""
+    with _load_lock:
+        load_data()
+
+def start_background_refresh():
+    """주기적 데이터 갱신 시작 (서버 시작 시 한 번 호출)"""
+    socketio.start_background_task(_periodic_refresh)
+
+def _get_analyzer(df):
+    """df별 DataAnalyzer 재사용"""
+    global _analyzer
+    if _analyzer is None or _analyzer.df is not df:
+        _analyzer = DataAnalyzer(df)
+    else:
+        _analyzer.current_date = datetime.now()
+    return _analyzer
 
-def _suffix_from_code(code: str):
-    """프로젝트 코드에서 접미사 부분 추출"""
-    m = re.match(r'[A-Z]\d{4}-([A-Z]+)$', str(code))
-    return m.group(1) if m else None
+# 프로젝트 코드 자동 생성 함수들
+# str.extract는 search로 동작하므로 코드 앞부분에 고정되도록 ^ 사용
+_RE_NUM = re.compile(r'^[A-Z](\d{4})-')
+_RE_SUFFIX = re.compile(r'^[A-Z]\d{4}-([A-Z]+)$')
+_RE_PREFIX = re.compile(r'^([A-Z])\d{4}-')
 
 def _build_company_prefix_map(df):
     """사업자-접두사 매핑 구축"""
     m = {}
-    # 기존 데이터에서 학습
+    # 기존 데이터에서 학습 (사업자별로 처음 등장한 접두사)
     if '프로젝트 코드' in df.columns and '사업자' in df.columns:
-        for _, row in df.iterrows():
-            code = str(row.get('프로젝트 코드',''))
-            comp = str(row.get('사업자','')).strip()
-            mm = re.match(r'([A-Z])\d{4}-', code)
-            if comp and mm and comp not in m:
-                m[comp] = mm.group(1)
+        pref = df['프로젝트 코드'].astype(str).str.extract(_RE_PREFIX, expand=False)
+        comp = df['사업자'].astype(str).str.strip()
+        mask = pref.notna() & comp.ne('')
+        first = pd.DataFrame({'c': comp[mask], 'p': pref[mask]}).drop_duplicates('c')
+        m = dict(zip(first['c'], first['p']))
     
     # 설정 파일에서 로드
-    config_map = _project_config.get('company_prefix_map', {})
-    for k, v in config_map.items():
+    for k, v in _CFG_COMPANY_PREFIX.items():
         m.setdefault(k, v)
     
     return m
@@ -122,81 +297,137 @@ def _build_company_prefix_map(df):
 def _build_owner_suffix_map(df):
     """담당자-접미사 매핑 구축"""
     # 설정 파일에서 기본 매핑 로드
-    m = {k: str(v).upper() for k, v in _project_config.get('owner_suffix_map', {}).items()}
+    m = dict(_CFG_OWNER_SUFFIX)
     
-    # 기존 데이터에서 학습
+    # 기존 데이터에서 학습 (담당자별 최빈 접미사, 동률이면 먼저 등장한 것)
     if '프로젝트 코드' in df.columns and '담당자' in df.columns:
-        grouped = defaultdict(list)
-        for _, row in df.iterrows():
-            name = str(row.get('담당자','')).strip()
-            code = str(row.get('프로젝트 코드','')).strip()
-            suf = _suffix_from_code(code)
-            if name and suf:
-                grouped[name].append(suf)
-        
-        for name, arr in grouped.items():
-            if arr:
-                common = Counter(arr).most_common(1)[0][0]
-                m.setdefault(name, common)
+        suf = df['프로젝트 코드'].astype(str).str.strip().str.extract(_RE_SUFFIX, expand=False)
+        name = df['담당자'].astype(str).str.strip()
+        mask = suf.notna() & name.ne('')
+        counts = pd.DataFrame({'n': name[mask], 's': suf[mask]}).groupby(['n', 's'], sort=False).size()
+        common = counts.sort_values(ascending=False, kind='stable').reset_index().drop_duplicates('n')
+        for n, sfx in zip(common['n'], common['s']):
+            m.setdefault(n, sfx)
     
     return m
 
 def _next_running_number(df):
     """다음 순번 찾기"""
-    nums = []
-    if '프로젝트 코드' in df.columns:
-        for c in df['프로젝트 코드'].astype(str):
-            n = _extract_number(c)
-            if n is not None:
-                nums.append(n)
-    return (max(nums) + 1) if nums else 1
-
-def _safe_next_running_number_with_retry(company: str, owner: str, max_retries: int = 5):
-    """재시도 로직이 있는 안전한 다음 순번 찾기 (동시성 대응)"""
-    import threading
-    import time
-    
-    # 전역 락 (메모리 기반, 단일 서버용)
-    if not hasattr(_safe_next_running_number_with_retry, '_lock'):
-        _safe_next_running_number_with_retry._lock = threading.RLock()
-    
-    for attempt in range(max_retries):
-        with _safe_next_running_number_with_retry._lock:
-            try:
-                # 구글 시트에서 최신 데이터 다시 로드
-                df = load_data()
-                if df is None:
-                    raise Exception("데이터를 불러올 수 없습니다")
-                
-                # 프로젝트 코드 생성
-                code = _auto_project_code(df, company, owner)
-                
-                # 생성된 코드가 이미 존재하는지 확인
-                if '프로젝트 코드' in df.columns:
-                    existing_codes = df['프로젝트 코드'].astype(str).tolist()
-                    if code in existing_codes:
-                        logger.warning(f"프로젝트 코드 충돌 감지: {code} (시도 {attempt + 1}/{max_retries})")
-                        if attempt < max_retries - 1:
-                            time.sleep(0.1 * (attempt + 1))  # 지수백오프
-                            continue
-                        else:
-                            raise Exception(f"프로젝트 코드 생성 실패: 최대 재시도 횟수 초과 ({code})")
-                
-                logger.info(f"프로젝트 코드 안전 생성 완료: {code} (시도 {attempt + 1}/{max_retries})")
-                return code
-                
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                time.sleep(0.1 * (attempt + 1))
+    if '프로젝트 코드' not in df.columns:
+        return 1
+    s = df['프로젝트 코드'].astype(str).str.extract(_RE_NUM, expand=False)
+    top = pd.to_numeric(s, errors='coerce').max()
+    return int(top) + 1 if pd.notna(top) else 1
+
+# 발급한 순번 카운터: 시트 최대값+1로 시드하고, 이후엔 증가 방향으로만 갱신
+_seq_lock = threading.Lock()
+_seq_next = 0
+
+def _take_running_number(sheet_next: int) -> int:
+    """아직 시트에 반영되지 않은 발급 번호와 겹치지 않는 다음 순번 예약"""
+    global _seq_next
+    with _seq_lock:
+        num = max(_seq_next, sheet_next)
+        _seq_next = num + 1
+    return num
+
+def _code_state(df):
+    """df별 (사업자-접두사 매핑, 담당자-접미사 매핑, 다음 순번) 캐시"""
+    if _code_cache.get('df') is not df:
+        _code_cache.clear()
+        _code_cache.update(
+            df=df,
+            comp_map=_build_company_prefix_map(df),
+            own_map=_build_owner_suffix_map(df),
+            next_num=_next_running_number(df),
+        )
+    return _code_cache['comp_map'], _code_cache['own_map'], _code_cache['next_num']
+
+def _project_index(df):
+    """프로젝트 코드 -> 행 위치 (중복 시 첫 번째 행), df가 바뀔 때만 다시 구성"""
+    if _index_cache.get('df') is not df:
+        codes = df['프로젝트 코드'].astype(str).tolist() if '프로젝트 코드' in df.columns else []
+        _index_cache.clear()
+        _index_cache.update(df=df, index=dict(zip(reversed(codes), range(len(codes) - 1, -1, -1))))
+    return _index_cache['index']
+
+_NO_HINT = object()
+
+def _find_sheet_row(manager, sheet_id, project_code):
+    """프로젝트 코드 -> 시트 행 번호 (1부터 시작)
+    시트에서 읽은 current_data의 인덱스로 바로 계산하고, 없거나 미확정이면 A열 검색으로 대체"""
+    # 재로드 중 _row_hints가 비워질 수 있으므로 확인과 조회를 한 번에
+    hint = _row_hints.get(project_code, _NO_HINT)
+    if hint is not _NO_HINT:
+        if hint is not None:
+            return hint
+        df = None
+    else:
+        df = current_data
+    if _data_from_sheet and df is not None:
+        pos = _project_index(df).get(project_code)
+        if pos is not None and df.index[pos] >= 0:
+            row_number = int(df.index[pos]) + 2  # 헤더 1행 + 1부터 시작
+            if not _VERIFY_SHEET_ROW:
+                return row_number
+            cell = manager.service.spreadsheets().values().get(
+                spreadsheetId=sheet_id,
+                range=f'공사 현황!A{row_number}'
+            ).execute().get('values', [[]])
+            if cell and cell[0] and cell[0][0] == project_code:
+                return row_number
+            logger.warning(f"캐시된 행 번호 불일치, A열 검색으로 대체: {project_code}")
+    row_number = manager.find_row_by_project_code(sheet_id, project_code)
+    if row_number:
+        _row_hints[project_code] = row_number
+    return row_number
+
+# 시트 ID -> '공사 현황' 시트의 편집 차단 보호 범위 [(range, unprotectedRanges)]
+_protected_cache = {}
+_RE_A1_CELL = re.compile(r'!([A-Z]+)(\d+)$')
+
+def _protected_ranges(manager, sheet_id):
+    """보호 범위 조회 (프로세스당 한 번, 보호 셀 오류가 났을 때만 호출)"""
+    if sheet_id not in _protected_cache:
+        meta = manager.service.spreadsheets().get(
+            spreadsheetId=sheet_id,
+            fields='sheets(properties(title),protectedRanges(range,unprotectedRanges,warningOnly,editors(users)))'
+        ).execute()
+        ranges = []
+        for sheet in meta.get('sheets', []):
+            if sheet.get('properties', {}).get('title') != '공사 현황':
                 continue
-    
-    raise Exception("프로젝트 코드 생성 실패: 예상치 못한 오류")
+            for pr in sheet.get('protectedRanges', []):
+                # 경고만 하는 보호, 이름 있는 범위 기준 보호, 서비스 계정이 편집자인 보호는 제외
+                if pr.get('warningOnly') or 'range' not in pr:
+                    continue
+                if manager.service_account_email in pr.get('editors', {}).get('users', []):
+                    continue
+                ranges.append((pr['range'], pr.get('unprotectedRanges', [])))
+        _protected_cache[sheet_id] = ranges
+    return _protected_cache[sheet_id]
+
+def _grid_contains(grid, row, col):
+    """GridRange(0-based, end 미포함, 생략 시 무한)에 셀이 포함되는지"""
+    return (grid.get('startRowIndex', 0) <= row < grid.get('endRowIndex', float('inf')) and
+            grid.get('startColumnIndex', 0) <= col < grid.get('endColumnIndex', float('inf')))
+
+def _is_protected_cell(protected, a1_range):
+    """'공사 현황!B12' 형태의 단일 셀이 보호 범위에 걸리는지"""
+    m = _RE_A1_CELL.search(a1_range)
+    if not m:
+        return False
+    row, col = int(m.group(2)) - 1, _COLUMN_INDEX[m.group(1)]
+    return any(_grid_contains(rng, row, col) and not any(_grid_contains(u, row, col) for u in unprotected)
+               for rng, unprotected in protected)
+
+def _code_exists(df, code: str) -> bool:
+    """기존 프로젝트 코드 여부 (O(1) 조회)"""
+    return code in _project_index(df)
 
-def _auto_project_code(df, company: str, owner: str) -> str:
-    """자동 프로젝트 코드 생성"""
-    comp_map = _build_company_prefix_map(df)
-    own_map = _build_owner_suffix_map(df)
+def _code_parts(df, company: str, owner: str):
+    """(접두사, 접미사, 시트 기준 다음 순번) - 매핑 실패 시 ValueError"""
+    comp_map, own_map, num = _code_state(df)
     
     prefix = comp_map.get(company.strip())
     suffix = own_map.get(owner.strip())
@@ -209,7 +440,43 @@ def _auto_project_code(df, company: str, owner: str) -> str:
         error_msg += f'사용 가능한 담당자: {", ".join(available_owners)}'
         raise ValueError(error_msg)
     
-    num = _next_running_number(df)
+    return prefix, suffix, num
+
+def _settle_appended_code(manager, sheet_id, append_result, code, prefix, suffix):
+    """추가 직후 A열을 다시 읽어 다른 프로세스가 같은 코드를 먼저 넣었는지 확인 (낙관적 동시성)
+    먼저 들어간 행이 코드를 유지하고, 나중 행은 A열 최대 순번 다음 번호로 코드를 바꿈"""
+    m = re.search(r'!A(\d+)', append_result.get('updates', {}).get('updatedRange', ''))
+    if not m:
+        return code
+    row_number = int(m.group(1))
+    
+    for _ in range(3):
+        column = manager.service.spreadsheets().values().get(
+            spreadsheetId=sheet_id,
+            range='공사 현황!A:A'
+        ).execute().get('values', [])
+        codes = [r[0] if r else '' for r in column]
+        first = next((i + 1 for i, c in enumerate(codes) if c == code), None)
+        if first is None or first == row_number:
+            return code
+        
+        nums = [int(n.group(1)) for n in map(_RE_NUM.match, codes) if n]
+        new_code = f"{prefix}{_take_running_number(max(nums, default=0) + 1):04d}-{suffix}"
+        manager.service.spreadsheets().values().update(
+            spreadsheetId=sheet_id,
+            range=f'공사 현황!A{row_number}',
+            valueInputOption='USER_ENTERED',
+            body={'values': [[new_code]]}
+        ).execute()
+        logger.warning(f"다른 등록과 코드 충돌({code}, {first}행) → {row_number}행 코드를 {new_code}로 변경")
+        code = new_code
+    return code
+
+def _auto_project_code(df, company: str, owner: str, reserve: bool = False) -> str:
+    """자동 프로젝트 코드 생성 (reserve=True면 순번을 예약해 동시 등록 시에도 중복되지 않음)"""
+    prefix, suffix, num = _code_parts(df, company, owner)
+    if reserve:
+        num = _take_running_number(num)
     return f"{prefix}{num:04d}-{suffix}"
 
 @app.route('/')
@@ -243,34 +510,43 @@ def serve_data_files(filename):
     data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
     return send_from_directory(data_dir, filename)
 
-def convert_numpy_int64(obj):
-    """numpy int64를 Python int로 변환"""
-    import numpy as np
-    if isinstance(obj, np.int64):
-        return int(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_numpy_int64(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_int64(v) for v in obj]
-    return obj
+def _data_etag():
+    """데이터 버전, 날짜(경과일 등 날짜 기준 분석), 요청 경로(쿼리 포함) 기반 ETag
+    (last_update는 내용이 같아도 주기적 갱신마다 바뀌므로 사용하지 않음)"""
+    key = f"{_data_version}|{datetime.now().date().isoformat()}|{request.full_path}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+def conditional_on_data(view):
+    """데이터가 바뀌지 않았으면 분석을 다시 하지 않고 304 응답"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if last_update is not None and _data_etag() in request.if_none_match:
+            rv = app.response_class(status=304)
+        else:
+            rv = app.make_response(view(*args, **kwargs))
+            if rv.status_code != 200 or last_update is None:
+                return rv
+        rv.set_etag(_data_etag())
+        rv.headers['Cache-Control'] = 'no-cache'  # 매번 ETag로 재검증
+        return rv
+    return wrapper
 
 @app.route('/api/summary')
+@conditional_on_data
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable)
 def get_summary():
     """요약 통계 API"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        analyzer = DataAnalyzer(df)
-        summary = analyzer.get_summary_stats()
-        
-        # numpy int64를 Python int로 변환
-        summary = convert_numpy_int64(summary)
+        analyzer = _get_analyzer(df)
+        summary = dict(analyzer.get_summary_stats())  # 분석기 캐시 결과는 복사해서 수정
         
         # 추가 정보
         summary['last_update'] = last_update.isoformat() if last_update else None
-        summary['total_records'] = int(len(df))  # 명시적으로 int로 변환
+        summary['total_records'] = len(df)
         
         return jsonify(summary)
         
@@ -279,16 +555,18 @@ def get_summary():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/monthly-sales')
+@conditional_on_data
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable)
 def get_monthly_sales():
     """월별 매출 API"""
     try:
         year = request.args.get('year', datetime.now().year, type=int)
         
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        analyzer = DataAnalyzer(df)
+        analyzer = _get_analyzer(df)
         monthly_sales = analyzer.get_monthly_sales(year)
         
         # JSON 직렬화 가능한 형태로 변환
@@ -301,14 +579,16 @@ def get_monthly_sales():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/regional-analysis')
+@conditional_on_data
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable)
 def get_regional_analysis():
     """지역별 분석 API"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        analyzer = DataAnalyzer(df)
+        analyzer = _get_analyzer(df)
         regional = analyzer.get_regional_analysis()
         
         result = regional.to_dict('records') if not regional.empty else []
@@ -319,14 +599,15 @@ def get_regional_analysis():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/outstanding-analysis')
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable)
 def get_outstanding_analysis():
     """미수금 분석 API"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        analyzer = DataAnalyzer(df)
+        analyzer = _get_analyzer(df)
         outstanding = analyzer.get_outstanding_analysis()
         
         # DataFrame을 dict로 변환
@@ -344,57 +625,32 @@ def get_outstanding_analysis():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/missing-data')
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable)
 def get_missing_data():
     """누락 데이터 분석 API"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        analyzer = DataAnalyzer(df)
-        missing = analyzer.check_missing_data()
-        
-        # DataFrame을 dict로 변환 (JSON 직렬화 가능하도록)
-        import json
-        result = {}
-        for key, value in missing.items():
-            if hasattr(value, 'to_dict'):
-                result[key] = value.to_dict('records')
-            elif isinstance(value, dict):
-                # dict 내부의 numpy 타입들을 Python 기본 타입으로 변환
-                converted_dict = {}
-                for k, v in value.items():
-                    if hasattr(v, 'item'):  # numpy 타입인 경우
-                        converted_dict[k] = v.item()
-                    elif hasattr(v, 'tolist'):  # numpy 배열인 경우
-                        converted_dict[k] = v.tolist()
-                    else:
-                        converted_dict[k] = v
-                result[key] = converted_dict
-            else:
-                # numpy 타입을 Python 기본 타입으로 변환
-                if hasattr(value, 'item'):
-                    result[key] = value.item()
-                elif hasattr(value, 'tolist'):
-                    result[key] = value.tolist()
-                else:
-                    result[key] = value
-        
-        return jsonify(result)
+        # check_missing_data는 JSON으로 바로 보낼 수 있는 기본 타입만 반환
+        return jsonify(_get_analyzer(df).check_missing_data())
         
     except Exception as e:
         logger.error(f"누락 데이터 분석 API 오류: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/brand-analysis')
+@conditional_on_data
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable)
 def get_brand_analysis():
     """브랜드별 분석 API"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        analyzer = DataAnalyzer(df)
+        analyzer = _get_analyzer(df)
         brands = analyzer.get_brand_analysis()
         
         result = brands.to_dict('records') if not brands.empty else []
@@ -417,25 +673,26 @@ def add_project_auto():
             return jsonify({"ok": False, "error": "사업자/담당자는 필수입니다"}), 400
 
         # 현재 데이터 로드
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({"ok": False, "error": "데이터를 불러올 수 없습니다"}), 500
         
-        # 안전한 자동 프로젝트 코드 생성 (동시성 대응)
+        # 필수 필드 검증 - 순번을 예약하기 전에 (프로젝트 코드는 아래에서 생성)
+        missing_fields = [field for field in _REQUIRED_FIELDS
+                         if field != "프로젝트 코드" and (field not in data or str(data.get(field, "")).strip() == "")]
+        
+        if missing_fields:
+            return jsonify({"ok": False, "error": f"필수 필드 누락: {', '.join(missing_fields)}"}), 400
+        
+        # 자동 프로젝트 코드 생성 (순번 예약으로 동시성 대응)
+        # 접두사/접미사는 한 번만 구하고, 충돌 시에는 순번만 다시 예약
         try:
-            code = _safe_next_running_number_with_retry(company, owner)
+            prefix, suffix, sheet_next = _code_parts(df, company, owner)
         except Exception as e:
             return jsonify({"ok": False, "error": str(e)}), 400
+        code = f"{prefix}{_take_running_number(sheet_next):04d}-{suffix}"
         
         data["프로젝트 코드"] = code
-        
-        # 필수 필드 검증
-        required_fields = _project_config.get("required_fields", ["프로젝트 코드", "현장 주소"])
-        missing_fields = [field for field in required_fields 
-                         if field not in data or str(data.get(field, "")).strip() == ""]
-        
-        if missing_fields:
-            return jsonify({"ok": False, "error": f"필수 필드 누락: {', '.join(missing_fields)}"}), 400
 
         # Google Sheets에 추가 (최종 중복 확인 포함)
         try:
@@ -443,28 +700,37 @@ def add_project_auto():
             if not sheet_id:
                 return jsonify({"ok": False, "error": "GOOGLE_SHEET_ID가 설정되지 않았습니다"}), 500
             
-            manager = GoogleSheetsManager()
+            manager = get_sheets_manager()
             
-            # 등록 직전 최종 중복 확인
-            latest_df = load_data()
-            if latest_df is not None and '프로젝트 코드' in latest_df.columns:
-                existing_codes = latest_df['프로젝트 코드'].astype(str).tolist()
-                if code in existing_codes:
-                    logger.error(f"등록 직전 프로젝트 코드 중복 감지: {code}")
-                    return jsonify({"ok": False, "error": f"프로젝트 코드가 중복됩니다: {code}. 다시 시도해주세요."}), 409
+            # 순번은 예약되어 있으므로 시트를 다시 읽지 않고 메모리 상의 코드 집합으로만 확인
+            # 충돌 시 카운터가 이미 다음 번호로 넘어가 있으므로 재예약 (시트 충돌/일시 오류는 append_row에서 재시도)
+            for _ in range(3):
+                if not _code_exists(df, code):
+                    break
+                logger.warning(f"등록 직전 프로젝트 코드 중복 감지, 재발급: {code}")
+                code = f"{prefix}{_take_running_number(sheet_next):04d}-{suffix}"
+                data["프로젝트 코드"] = code
+            else:
+                logger.error(f"프로젝트 코드 재발급 실패: {code}")
+                return jsonify({"ok": False, "error": f"프로젝트 코드가 중복됩니다: {code}. 다시 시도해주세요."}), 409
             
             values = convert_form_data_to_sheet_row(data, manager)
-            manager.append_row(sheet_id, values)
+            result = manager.append_row(sheet_id, values)
             
-            # 로컬 데이터 새로고침
-            load_data()
+            # 다른 프로세스와 동시에 같은 코드를 발급했으면 나중 행의 코드를 교체
+            if _VERIFY_APPEND_CODE:
+                settled = _settle_appended_code(manager, sheet_id, result, code, prefix, suffix)
+                if settled != code:
+                    code = data["프로젝트 코드"] = settled
+                    values[_SHEET_COLUMN_INDEX['프로젝트 코드']] = code
+            
+            # 로컬 데이터에 변경분만 반영
+            row = _row_from_values(values)
+            _apply_local_change(manager, code, row=row)
             
             # 실시간 업데이트 알림
-            socketio.emit('data_updated', {
-                'message': f"새 프로젝트가 등록되었습니다: {code}",
-                'timestamp': datetime.now().isoformat(),
-                'action': 'create'
-            })
+            _emit_project_change('create', code, f"새 프로젝트가 등록되었습니다: {code}",
+                                 row=_row_payload(manager, row))
             
             return jsonify({"ok": True, "project_code": code})
             
@@ -487,7 +753,7 @@ def preview_project_code():
             return jsonify({"ok": False, "error": "사업자와 담당자가 필요합니다"})
 
         # 현재 데이터 로드
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({"ok": False, "error": "데이터를 불러올 수 없습니다"})
         
@@ -502,64 +768,60 @@ def preview_project_code():
         logger.error(f"프로젝트 코드 미리보기 오류: {e}")
         return jsonify({"ok": False, "error": "서버 오류가 발생했습니다"})
 
+_EMPTY_OPTION_VALUES = ['', '-', '없음', 'N/A', 'n/a']
+
+def _unique_options(s):
+    """공백 제거 후 빈 값/자리표시 값을 뺀 고유값 (정렬 전)"""
+    s = s.dropna().astype(str).str.strip()
+    return s[~s.isin(_EMPTY_OPTION_VALUES)].unique().tolist()
+
+def _get_cached_options(df):
+    """드롭다운 옵션 - df가 바뀔 때만 다시 계산"""
+    if _options_cache.get('df') is df:
+        return _options_cache['options']
+    
+    companies = _unique_options(df["사업자"]) if "사업자" in df.columns else []
+    owners = _unique_options(df["담당자"]) if "담당자" in df.columns else []
+    
+    # 설정 파일에서도 추가
+    companies = sorted(_CFG_COMPANIES.union(companies))
+    owners = sorted(_CFG_OWNERS.union(owners))
+    
+    # 공사 구분, 기계 분류, 브랜드 추가 (2800-2803행 기준, 0-based index이므로 2799-2802)
+    work_categories, machine_types, brands = [], [], []
+    try:
+        if len(df) >= 2803:
+            sample_rows = df.iloc[2799:2803]
+            if "공사 구분" in df.columns:
+                work_categories = sorted(_unique_options(sample_rows["공사 구분"]))
+            if "기계 분류" in df.columns:
+                machine_types = sorted(_unique_options(sample_rows["기계 분류"]))
+            if "브랜드" in df.columns:
+                brands = sorted(_unique_options(sample_rows["브랜드"]))
+    except Exception as e:
+        logger.warning(f"샘플 데이터 추출 오류: {e}")
+    
+    options = {
+        "companies": companies,
+        "owners": owners,
+        "work_categories": work_categories,
+        "machine_types": machine_types,
+        "brands": brands
+    }
+    _options_cache.clear()
+    _options_cache.update(df=df, options=options)
+    return options
+
 @app.route('/api/meta/options', methods=['GET'])
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable)
 def get_meta_options():
     """드롭다운용 옵션 API (사업자, 담당자 목록)"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        # 사업자 목록 추출
-        companies = []
-        if "사업자" in df.columns:
-            companies = sorted(set(x.strip() for x in df["사업자"].astype(str) 
-                                 if x.strip() and x.strip() not in ("-", "없음", "N/A", "n/a")))
-        
-        # 담당자 목록 추출
-        owners = []
-        if "담당자" in df.columns:
-            owners = sorted(set(x.strip() for x in df["담당자"].astype(str) 
-                              if x.strip() and x.strip() not in ("-", "없음", "N/A", "n/a")))
-        
-        # 설정 파일에서도 추가
-        config_companies = list(_project_config.get('company_prefix_map', {}).keys())
-        config_owners = list(_project_config.get('owner_suffix_map', {}).keys())
-        
-        companies = sorted(set(companies + config_companies))
-        owners = sorted(set(owners + config_owners))
-        
-        # 공사 구분, 기계 분류, 브랜드 추가 (2800-2803행 기준)
-        work_categories = []
-        machine_types = []
-        brands = []
-        
-        try:
-            # 2800-2803행 데이터 추출 (0-based index이므로 2799-2802)
-            if len(df) >= 2803:
-                sample_rows = df.iloc[2799:2803]
-                
-                if "공사 구분" in df.columns:
-                    work_categories = sorted(set(x.strip() for x in sample_rows["공사 구분"].astype(str) 
-                                               if x.strip() and x.strip() not in ("-", "없음", "N/A", "n/a")))
-                
-                if "기계 분류" in df.columns:  
-                    machine_types = sorted(set(x.strip() for x in sample_rows["기계 분류"].astype(str)
-                                             if x.strip() and x.strip() not in ("-", "없음", "N/A", "n/a")))
-                
-                if "브랜드" in df.columns:
-                    brands = sorted(set(x.strip() for x in sample_rows["브랜드"].astype(str)
-                                      if x.strip() and x.strip() not in ("-", "없음", "N/A", "n/a")))
-        except Exception as e:
-            logger.warning(f"샘플 데이터 추출 오류: {e}")
-        
-        return jsonify({
-            "companies": companies,
-            "owners": owners,
-            "work_categories": work_categories,
-            "machine_types": machine_types,
-            "brands": brands
-        })
+        return jsonify(_get_cached_options(df))
         
     except Exception as e:
         logger.error(f"옵션 API 오류: {str(e)}")
@@ -602,26 +864,26 @@ def handle_disconnect():
     """클라이언트 연결 해제 처리"""
     logger.info('클라이언트 연결이 해제되었습니다.')
 
+def _records_json(df):
+    """목록 API와 실시간 알림에서 같은 형식으로 쓰는 records JSON"""
+    # 빈 값이 있는 문자열(string/category 포함) 컬럼만 ''로 채움 (얕은 복사본에 교체된 컬럼만 새로 할당)
+    # 숫자 NaN/날짜 NaT는 to_json이 null로, 날짜는 ISO 문자열로 직렬화
+    out = df.copy(deep=False)
+    for col in df.select_dtypes(['object', 'string', 'category']).columns:
+        if df[col].hasnans:
+            out[col] = df[col].astype(object).fillna('')
+    return out.to_json(orient='records', date_format='iso', force_ascii=False, default_handler=str)
+
 @app.route('/api/projects/list')
+@cache.cached(timeout=60, response_filter=_cacheable)
 def get_projects_list():
     """프로젝트 목록 API"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
-        # DataFrame을 dict 리스트로 변환 (NaN 값 처리)
-        df = df.fillna('')  # NaN 값을 빈 문자열로 변환
-        
-        # 날짜 컬럼들을 문자열로 변환
-        date_columns = ['공사 시작', '공사 종료', '수금 날짜', '공사 확정']
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = df[col].astype(str).replace('NaT', '').replace('nan', '')
-        
-        projects = df.to_dict('records')
-        
-        return jsonify(projects)
+        return app.response_class(_records_json(df), mimetype='application/json')
         
     except Exception as e:
         logger.error(f"프로젝트 목록 API 오류: {str(e)}")
@@ -637,7 +899,7 @@ def get_next_project_code():
         if not sheet_id:
             return jsonify({'error': 'GOOGLE_SHEET_ID가 설정되지 않았습니다.'}), 500
         
-        manager = GoogleSheetsManager()
+        manager = get_sheets_manager()
         project_code = manager.get_next_project_code(sheet_id, region_code)
         
         return jsonify({'project_code': project_code})
@@ -656,7 +918,7 @@ def create_project():
         if not sheet_id:
             return jsonify({'error': 'GOOGLE_SHEET_ID가 설정되지 않았습니다.'}), 500
         
-        manager = GoogleSheetsManager()
+        manager = get_sheets_manager()
         
         # 데이터를 구글 시트 형식으로 변환
         values = convert_form_data_to_sheet_row(data, manager)
@@ -664,15 +926,13 @@ def create_project():
         # 구글 시트에 추가
         result = manager.append_row(sheet_id, values)
         
-        # 로컬 데이터 새로고침
-        load_data()
+        # 로컬 데이터에 변경분만 반영
+        row = _row_from_values(values)
+        _apply_local_change(manager, data.get('projectCode', ''), row=row)
         
         # 실시간 업데이트 알림
-        socketio.emit('data_updated', {
-            'message': f"새 프로젝트가 등록되었습니다: {data.get('projectCode', '')}",
-            'timestamp': datetime.now().isoformat(),
-            'action': 'create'
-        })
+        _emit_project_change('create', data.get('projectCode', ''),
+                             f"새 프로젝트가 등록되었습니다: {data.get('projectCode', '')}", row=row)
         
         return jsonify({'success': True, 'project_code': data.get('projectCode', '')})
         
@@ -684,17 +944,17 @@ def create_project():
 def get_project(project_code):
     """프로젝트 상세 정보 API"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
         
         # 프로젝트 코드로 찾기
-        project_row = df[df['프로젝트 코드'] == project_code]
+        idx = _project_index(df).get(project_code)
         
-        if project_row.empty:
+        if idx is None:
             return jsonify({'error': '프로젝트를 찾을 수 없습니다.'}), 404
         
-        project = project_row.iloc[0].to_dict()
+        project = df.iloc[idx].to_dict()
         
         return jsonify(project)
         
@@ -712,60 +972,26 @@ def update_project(project_code):
         if not sheet_id:
             return jsonify({'error': 'GOOGLE_SHEET_ID가 설정되지 않았습니다.'}), 500
         
-        manager = GoogleSheetsManager()
-        
-        # 프로젝트가 있는 행 찾기 (직접 구현)
-        search_result = manager.service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range='공사 현황!A:A'
-        ).execute()
-        
-        values = search_result.get('values', [])
-        row_number = None
+        manager = get_sheets_manager()
         
-        for i, row in enumerate(values):
-            if row and len(row) > 0 and row[0] == project_code:
-                row_number = i + 1  # 1부터 시작
-                break
+        # 프로젝트가 있는 행 찾기 (메모리 인덱스 우선)
+        row_number = _find_sheet_row(manager, sheet_id, project_code)
         
         if not row_number:
             return jsonify({'error': '프로젝트를 찾을 수 없습니다.'}), 404
         
         # 인라인 편집 데이터인지 확인 (한국어 필드명 포함)
-        korean_fields = ['현장 주소', '사업자', '현장 담당자', '도급 구분', '담당자 연락처', '시공자', '담당자 이메일', '견적서 및 계약서 폴더 경로']
-        is_inline_data = any(field in data for field in korean_fields)
+        is_inline_data = not _INLINE_MARKER_FIELDS.isdisjoint(data)
         
         if is_inline_data:
-            # 인라인 편집 데이터 - 배치 업데이트 방식 사용
-            updates = []
-            field_column_mapping = {
-                # 기본정보
-                '사업자': 'B',
-                '현장 담당자': 'N', 
-                '도급 구분': 'L',
-                '담당자 연락처': 'O',
-                '시공자': 'M',
-                '담당자 이메일': 'P',
-                '현장 주소': 'E',
-                # 공사정보
-                '공사 구분': 'F',
-                '기계 분류': 'G',
-                '브랜드': 'H',
-                '공사 시작': 'I',
-                '공사 종료': 'J',
-                '공사 내용': 'K',
-                '공사 확정': 'AL',
-                # 문서 정보
-                '견적서 및 계약서 폴더 경로': 'AK'
-            }
-            
+            # 인라인 편집 데이터 - 배치 업데이트 방식 사용 (연속된 열은 한 범위로)
+            changed = {}
+            cells = {}
             for field_name, value in data.items():
-                if field_name in field_column_mapping:
-                    column = field_column_mapping[field_name]
-                    updates.append({
-                        'range': f'공사 현황!{column}{row_number}',
-                        'values': [[value]]
-                    })
+                if field_name in _INLINE_EDIT_COLUMNS:
+                    cells[_INLINE_EDIT_COLUMNS[field_name]] = value
+                    changed[field_name] = value
+            updates = _row_update_ranges(row_number, cells)
             
             if updates:
                 batch_update_body = {
@@ -781,15 +1007,16 @@ def update_project(project_code):
             values = convert_form_data_to_sheet_row(data, manager)
             result = manager.update_row(sheet_id, row_number, values)
         
-        # 로컬 데이터 새로고침
-        load_data()
+        # 로컬 데이터에 변경분만 반영
+        if is_inline_data:
+            row, fields = None, changed
+        else:
+            row, fields = _row_from_values(values), None
+        _apply_local_change(manager, project_code, row=row, fields=fields)
         
         # 실시간 업데이트 알림
-        socketio.emit('data_updated', {
-            'message': f"프로젝트가 수정되었습니다: {project_code}",
-            'timestamp': datetime.now().isoformat(),
-            'action': 'update'
-        })
+        _emit_project_change('update', project_code, f"프로젝트가 수정되었습니다: {project_code}",
+                             row=row, fields=fields)
         
         return jsonify({'ok': True, 'success': True, 'project_code': project_code})
         
@@ -802,78 +1029,183 @@ def update_project(project_code):
 # def delete_project(project_code):
 #     """프로젝트 삭제 API (구글 시트에서는 빈 행으로 만들기)"""
 
+# 폼 필드명을 구글 시트 컬럼명으로 매핑
+_FORM_FIELD_MAPPING = {
+    'projectCode': '프로젝트 코드',
+    'company': '사업자',
+    'region': '담당자',
+    'client': '거래처',
+    'address': '현장 주소',
+    'workType': '공사 구분',
+    'equipmentType': '기계 분류',
+    'brand': '브랜드',
+    'startDate': '공사 시작',
+    'endDate': '공사 종료',
+    'workDescription': '공사 내용',
+    'contractType': '도급 구분',
+    'constructor': '시공자',
+    'siteManager': '현장 담당자',
+    'managerPhone': '담당자 연락처',
+    'managerEmail': '담당자 이메일',
+    'amount1': '총액 1',
+    'vatIncluded': '부가세',
+    'amount2': '총액 2',
+    'downPayment': '계약금',
+    'middlePayment': '중도금',
+    'finalPayment': '잔금',
+    'outstanding': '미수금',
+    'invoice': '계산서',
+    'paymentDate': '수금 날짜',
+    'paymentConfirmed': '수금 확인',
+    'productCost': '제품대',
+    'laborCost': '도급비',
+    'materialCost': '자재비',
+    'otherCost': '기타비',
+    'netProfit': '순익',
+    'marginRate': '마진율',
+    'notes': '비고',
+    'downPaymentPayer': '계약금 입금자명',
+    'middlePaymentPayer': '중도금 입금자명',
+    'finalPaymentPayer': '잔금 입금자명'
+}
+
+# 시트 컬럼 문자 <-> 0-based 인덱스 (A..Z, AA..ZZ)
+_COLUMN_LETTERS = list(string.ascii_uppercase) + [a + b for a in string.ascii_uppercase for b in string.ascii_uppercase]
+_COLUMN_INDEX = {letter: i for i, letter in enumerate(_COLUMN_LETTERS)}
+
+# 시트 컬럼명 -> 폼 필드명 (역방향 조회용)
+_SHEET_TO_FORM_FIELD = {sheet_column: form_key for form_key, sheet_column in _FORM_FIELD_MAPPING.items()}
+
+# 시트 컬럼명 -> 열 인덱스, 폼이 채우는 (열 인덱스, 폼 필드명) 목록 - 모두 import 시 한 번만 계산
+_SHEET_COLUMN_INDEX = {name: _COLUMN_INDEX[letter] for letter, name in GoogleSheetsManager.COLUMN_MAPPING.items()}
+_FORM_COLUMN_SLOTS = [(idx, _SHEET_TO_FORM_FIELD[name]) for name, idx in _SHEET_COLUMN_INDEX.items()
+                      if name in _SHEET_TO_FORM_FIELD]
+
+# 인라인 편집 가능한 필드 -> 시트 열 문자 (요청마다 dict를 만들지 않도록 import 시 한 번만 구성)
+_FIELD_TO_COLUMN_LETTER = MappingProxyType({name: letter for letter, name in GoogleSheetsManager.COLUMN_MAPPING.items()})
+_INLINE_EDIT_COLUMNS = MappingProxyType({field: _FIELD_TO_COLUMN_LETTER[field] for field in (
+    # 기본정보
+    '사업자', '현장 담당자', '도급 구분', '담당자 연락처', '시공자', '담당자 이메일', '현장 주소',
+    # 공사정보
+    '공사 구분', '기계 분류', '브랜드', '공사 시작', '공사 종료', '공사 내용', '공사 확정',
+    # 문서 정보
+    '견적서 및 계약서 폴더 경로',
+)})
+# inline_update_direct는 문서 경로를 수정하지 않음
+_INLINE_DIRECT_COLUMNS = MappingProxyType({f: c for f, c in _INLINE_EDIT_COLUMNS.items() if f != '견적서 및 계약서 폴더 경로'})
+# 이 필드 중 하나라도 있으면 update_project는 인라인 편집 데이터로 처리
+_INLINE_MARKER_FIELDS = frozenset(['현장 주소', '사업자', '현장 담당자', '도급 구분', '담당자 연락처', '시공자', '담당자 이메일', '견적서 및 계약서 폴더 경로'])
+
+def _fmt_other(value):
+    return str(value) if value else ''
+
+# 값 타입별 셀 포맷 (type()으로 바로 찾아 isinstance 체인을 피함, 그 외 타입은 _fmt_other)
+_CELL_FORMATTERS = {
+    bool: lambda v: 'TRUE' if v else 'FALSE',
+    int: lambda v: str(v) if v != 0 else '',
+    float: lambda v: str(v) if v != 0 else '',
+    str: lambda v: v,
+}
+
+_SHEET_ROW_WIDTH = len(GoogleSheetsManager.COLUMN_MAPPING)  # A..AM = 39
+
 def convert_form_data_to_sheet_row(form_data, manager):
     """폼 데이터를 구글 시트 행 형식으로 변환"""
-    column_mapping = manager.get_column_mapping()
-    
-    # 폼 필드명을 구글 시트 컬럼명으로 매핑
-    field_mapping = {
-        'projectCode': '프로젝트 코드',
-        'company': '사업자',
-        'region': '담당자',
-        'client': '거래처',
-        'address': '현장 주소',
-        'workType': '공사 구분',
-        'equipmentType': '기계 분류',
-        'brand': '브랜드',
-        'startDate': '공사 시작',
-        'endDate': '공사 종료',
-        'workDescription': '공사 내용',
-        'contractType': '도급 구분',
-        'constructor': '시공자',
-        'siteManager': '현장 담당자',
-        'managerPhone': '담당자 연락처',
-        'managerEmail': '담당자 이메일',
-        'amount1': '총액 1',
-        'vatIncluded': '부가세',
-        'amount2': '총액 2',
-        'downPayment': '계약금',
-        'middlePayment': '중도금',
-        'finalPayment': '잔금',
-        'outstanding': '미수금',
-        'invoice': '계산서',
-        'paymentDate': '수금 날짜',
-        'paymentConfirmed': '수금 확인',
-        'productCost': '제품대',
-        'laborCost': '도급비',
-        'materialCost': '자재비',
-        'otherCost': '기타비',
-        'netProfit': '순익',
-        'marginRate': '마진율',
-        'notes': '비고',
-        'downPaymentPayer': '계약금 입금자명',
-        'middlePaymentPayer': '중도금 입금자명',
-        'finalPaymentPayer': '잔금 입금자명'
-    }
-    
-    # 39개 컬럼에 맞춰 빈 리스트 생성
-    values = [''] * 39
-    
-    # 각 컬럼에 해당하는 값 설정
-    for column_letter, column_name in column_mapping.items():
-        column_index = ord(column_letter) - ord('A') if len(column_letter) == 1 else \
-                      (ord(column_letter[0]) - ord('A') + 1) * 26 + (ord(column_letter[1]) - ord('A'))
-        
-        # 폼 데이터에서 해당 값 찾기
-        form_field = None
-        for form_key, sheet_column in field_mapping.items():
-            if sheet_column == column_name:
-                form_field = form_key
-                break
-        
-        if form_field and form_field in form_data:
+    values = [''] * _SHEET_ROW_WIDTH
+    for column_index, form_field in _FORM_COLUMN_SLOTS:
+        if form_field in form_data:
             value = form_data[form_field]
-            
-            # 데이터 타입별 처리
-            if isinstance(value, bool):
-                values[column_index] = 'TRUE' if value else 'FALSE'
-            elif isinstance(value, (int, float)):
-                values[column_index] = str(value) if value != 0 else ''
-            else:
-                values[column_index] = str(value) if value else ''
-    
+            values[column_index] = _CELL_FORMATTERS.get(type(value), _fmt_other)(value)
     return values
 
+def _row_update_ranges(row_number, cells):
+    """{열 문자: 값} -> 연속된 열끼리 한 범위로 묶은 batchUpdate data
+    (사이에 빈 열이 있으면 기존 값을 덮어쓰지 않도록 범위를 나눔)"""
+    data = []
+    start, prev, vals = None, None, []
+    for idx, value in sorted((_COLUMN_INDEX[c], v) for c, v in cells.items()):
+        if prev is not None and idx == prev + 1:
+            vals.append(value)
+        else:
+            if vals:
+                data.append((start, vals))
+            start, vals = idx, [value]
+        prev = idx
+    if vals:
+        data.append((start, vals))
+    return [{
+        'range': f'공사 현황!{_COLUMN_LETTERS[lo]}{row_number}:{_COLUMN_LETTERS[lo + len(v) - 1]}{row_number}',
+        'values': [v]
+    } for lo, v in data]
+
+def _row_from_values(values):
+    """시트 행 값 리스트 -> {컬럼명: 값}"""
+    return {name: values[idx] for name, idx in _SHEET_COLUMN_INDEX.items() if idx < len(values)}
+
+def _apply_local_change(manager, project_code, row=None, fields=None):
+    """쓰기 직후 current_data에 변경분만 반영하고, 시트 전체 재조회는 백그라운드로 미룸"""
+    global current_data, last_update, _data_version
+    try:
+        if current_data is not None and '프로젝트 코드' in current_data.columns:
+            patch = dict(row if row is not None else fields or {})
+            if project_code:
+                patch['프로젝트 코드'] = project_code
+            # 시트에서 읽을 때와 같은 타입 변환 적용
+            new = manager._preprocess_data(pd.DataFrame([patch]))
+            mask = current_data['프로젝트 코드'].astype(str).eq(str(patch.get('프로젝트 코드', '')))
+            df = None
+            if mask.any():
+                # 새 객체로 교체해야 df 기준 캐시(코드/옵션/분석기)가 무효화됨
+                df = current_data.copy()
+                cols = [c for c in new.columns if c in df.columns]
+                values = new[cols].iloc[0]
+                # category 컬럼은 새 값을 범주에 먼저 추가, string 컬럼에는 문자열만 대입 가능
+                for c in cols:
+                    v = values[c]
+                    if isinstance(df[c].dtype, pd.CategoricalDtype):
+                        if pd.notna(v) and v not in df[c].cat.categories:
+                            df[c] = df[c].cat.add_categories([v])
+                    elif isinstance(df[c].dtype, pd.StringDtype) and pd.notna(v) and not isinstance(v, str):
+                        values[c] = str(v)
+                df.loc[mask, cols] = values.values
+            elif row is not None:
+                # 추가된 행의 시트 위치는 재로드 전까지 미확정(-1) → 행 검색 시 A열 조회로 대체
+                new.index = [-1]
+                df = pd.concat([current_data, new])
+            if df is not None:
+                current_data = df
+                _data_version += 1
+                last_update = datetime.now()
+                cache.clear()
+    except Exception as e:
+        logger.warning(f"로컬 데이터 반영 실패 (백그라운드 새로고침으로 대체): {e}")
+    
+    # 드라이브 수정 시각 반영이 늦을 수 있으므로 시트 캐시를 비우고 재조회
+    invalidate_sheet_cache(os.getenv('GOOGLE_SHEET_ID'))
+    socketio.start_background_task(_reload_data)
+
+def _row_payload(manager, row):
+    """시트 표시 문자열("1,234,000" 등)로 된 행을 /api/projects/list와 같은 타입·형식으로 변환"""
+    try:
+        return json.loads(_records_json(manager._preprocess_data(pd.DataFrame([row]))))[0]
+    except Exception as e:
+        logger.warning(f"알림용 행 변환 실패, 원본 값 전송: {e}")
+        return row
+
+def _emit_project_change(action, project_code, message, row=None, fields=None):
+    """변경분(row: 전체 행, fields: 바뀐 필드)만 담아 알림 - 클라이언트는 목록을 다시 받지 않고 로컬 패치"""
+    payload = {
+        'message': message,
+        'timestamp': datetime.now().isoformat(),
+        'action': action,
+        'project_code': project_code
+    }
+    if row is not None:
+        payload['row'] = row
+    if fields is not None:
+        payload['fields'] = fields
+    socketio.emit('data_updated', payload)
+
 @app.route('/api/update-project-inline', methods=['POST'])
 def update_project_inline():
     """프로젝트 인라인 편집 API - 구글 시트 직접 업데이트"""
@@ -888,29 +1220,34 @@ def update_project_inline():
         if not sheet_id:
             return jsonify({'ok': False, 'error': 'GOOGLE_SHEET_ID가 설정되지 않았습니다.'}), 500
         
-        manager = GoogleSheetsManager()
+        manager = get_sheets_manager()
         
-        # 프로젝트가 있는 행 찾기
-        row_number = manager.find_row_by_project_code(sheet_id, project_code)
+        # 프로젝트가 있는 행 찾기 (메모리 인덱스 우선)
+        row_number = _find_sheet_row(manager, sheet_id, project_code)
         
         if not row_number:
             return jsonify({'ok': False, 'error': '프로젝트를 찾을 수 없습니다.'}), 404
         
         # 현재 행의 데이터를 가져오기 (전체 행 데이터 보존을 위해)
-        current_row_range = f'공사 현황!A{row_number}:AM{row_number}'
-        result = manager.service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range=current_row_range
-        ).execute()
+        def read_row(n):
+            result = manager.service.spreadsheets().values().get(
+                spreadsheetId=sheet_id,
+                range=f'공사 현황!A{n}:AM{n}'
+            ).execute()
+            return result.get('values', [[]])[0] if result.get('values') else []
         
-        current_values = result.get('values', [[]])[0] if result.get('values') else []
+        current_values = read_row(row_number)
         
-        # 현재 값을 리스트로 확장 (39개 컬럼)
-        while len(current_values) < 39:
-            current_values.append('')
+        # 어차피 읽는 A열 값으로 캐시된 행 번호를 검증 (어긋났으면 A열 검색 후 다시 읽음)
+        if not current_values or current_values[0] != project_code:
+            logger.warning(f"캐시된 행 번호 불일치, A열 검색으로 대체: {project_code} ({row_number}행)")
+            row_number = manager.find_row_by_project_code(sheet_id, project_code)
+            if not row_number:
+                return jsonify({'ok': False, 'error': '프로젝트를 찾을 수 없습니다.'}), 404
+            current_values = read_row(row_number)
         
-        # 컬럼 매핑 가져오기
-        column_mapping = manager.get_column_mapping()
+        # 현재 값을 리스트로 확장 (39개 컬럼)
+        current_values.extend([''] * (_SHEET_ROW_WIDTH - len(current_values)))
         
         # 업데이트할 필드만 변경
         for field_name, new_value in data.items():
@@ -918,15 +1255,7 @@ def update_project_inline():
                 continue  # 프로젝트 코드는 변경하지 않음
             
             # 필드명에 해당하는 컬럼 인덱스 찾기
-            column_index = None
-            for col_letter, col_name in column_mapping.items():
-                if col_name == field_name:
-                    # 컬럼 문자를 인덱스로 변환
-                    if len(col_letter) == 1:
-                        column_index = ord(col_letter) - ord('A')
-                    else:
-                        column_index = (ord(col_letter[0]) - ord('A') + 1) * 26 + (ord(col_letter[1]) - ord('A'))
-                    break
+            column_index = _SHEET_COLUMN_INDEX.get(field_name)
             
             if column_index is not None and column_index < len(current_values):
                 # 값 업데이트
@@ -938,17 +1267,13 @@ def update_project_inline():
         # 구글 시트 업데이트
         update_result = manager.update_row(sheet_id, row_number, current_values)
         
-        # 로컬 데이터 새로고침
-        load_data()
+        # 로컬 데이터에 변경분만 반영
+        row = _row_from_values(current_values)
+        _apply_local_change(manager, project_code, row=row)
         
         # 실시간 업데이트 알림
-        socketio.emit('data_updated', {
-            'message': f"프로젝트가 수정되었습니다: {project_code}",
-            'timestamp': datetime.now().isoformat(),
-            'action': 'inline_update',
-            'project_code': project_code,
-            'updated_fields': list(data.keys())
-        })
+        _emit_project_change('inline_update', project_code, f"프로젝트가 수정되었습니다: {project_code}",
+                             row=_row_payload(manager, row))
         
         return jsonify({
             'ok': True,
@@ -999,7 +1324,7 @@ def handle_request_update():
 def debug_headers():
     """Google Sheets 헤더 확인용 디버깅 엔드포인트"""
     try:
-        df = current_data if current_data is not None else load_data()
+        df = get_current_data()
         if df is None:
             return jsonify({'error': '데이터를 불러올 수 없습니다.'}), 500
             
@@ -1020,7 +1345,7 @@ def debug_headers():
         column_mapping = {}
         for i, col in enumerate(headers):
             # A=0, B=1, C=2... -> A, B, C...
-            column_letter = chr(ord('A') + i) if i < 26 else f"A{chr(ord('A') + i - 26)}"
+            column_letter = _COLUMN_LETTERS[i]
             column_mapping[col] = {
                 'index': i,
                 'letter': column_letter
@@ -1052,41 +1377,19 @@ def inline_update_direct():
         if not sheet_id:
             return jsonify({'ok': False, 'error': 'GOOGLE_SHEET_ID가 설정되지 않았습니다.'}), 500
         
-        manager = GoogleSheetsManager()
+        manager = get_sheets_manager()
         
         # 프로젝트 코드로 행 찾기
         logger.info(f"프로젝트 코드 {project_code}의 행 번호를 찾는 중...")
         
-        # A열에서 프로젝트 코드 검색
-        search_result = manager.service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range='공사 현황!A:A'
-        ).execute()
-        
-        values = search_result.get('values', [])
-        row_number = None
-        
-        for i, row in enumerate(values):
-            if row and len(row) > 0 and row[0] == project_code:
-                row_number = i + 1  # 1부터 시작
-                break
+        # 메모리 인덱스 우선, 없으면 A열 검색
+        row_number = _find_sheet_row(manager, sheet_id, project_code)
         
         if not row_number:
             logger.error(f"프로젝트 코드 {project_code}를 찾을 수 없습니다. 데이터 새로고침 후 재시도...")
             # 데이터를 새로 로드하고 재시도
             load_data()
-            
-            # 다시 검색 시도
-            search_result = manager.service.spreadsheets().values().get(
-                spreadsheetId=sheet_id,
-                range='공사 현황!A:A'
-            ).execute()
-            
-            values = search_result.get('values', [])
-            for i, row in enumerate(values):
-                if row and len(row) > 0 and row[0] == project_code:
-                    row_number = i + 1
-                    break
+            row_number = _find_sheet_row(manager, sheet_id, project_code)
             
             if not row_number:
                 return jsonify({'ok': False, 'error': f'프로젝트 코드 {project_code}를 찾을 수 없습니다.'}), 404
@@ -1097,31 +1400,12 @@ def inline_update_direct():
         updates = []
         
         # 필드별로 해당 열에 업데이트
-        field_column_mapping = {
-            # 기본정보
-            '사업자': 'B',
-            '현장 담당자': 'N', 
-            '도급 구분': 'L',
-            '담당자 연락처': 'O',
-            '시공자': 'M',
-            '담당자 이메일': 'P',
-            '현장 주소': 'E',
-            # 공사정보
-            '공사 구분': 'F',
-            '기계 분류': 'G',
-            '브랜드': 'H',
-            '공사 시작': 'I',
-            '공사 종료': 'J',
-            '공사 내용': 'K',
-            '공사 확정': 'AL'
-        }
-        
         for field_name, value in data.items():
             if field_name == 'projectCode':
                 continue
             
-            if field_name in field_column_mapping:
-                column = field_column_mapping[field_name]
+            if field_name in _INLINE_DIRECT_COLUMNS:
+                column = _INLINE_DIRECT_COLUMNS[field_name]
                 range_name = f'공사 현황!{column}{row_number}'
                 logger.info(f"업데이트 대상: {field_name} -> {range_name} = {value}")
                 updates.append({
@@ -1149,13 +1433,39 @@ def inline_update_direct():
                 
             except Exception as api_error:
                 if "protected cell" in str(api_error):
-                    logger.warning("보호된 셀 감지 - 단일 셀 업데이트로 재시도")
+                    logger.warning("보호된 셀 감지 - 보호 범위를 제외하고 한 번에 재시도")
                     
-                    # 단일 셀씩 개별 업데이트 시도
                     updated_cells = 0
                     failed_updates = []
                     
-                    for update in updates:
+                    # 시트의 보호 범위(프로세스별 캐시)로 막힌 셀을 먼저 걸러냄
+                    remaining = updates
+                    try:
+                        protected = _protected_ranges(manager, sheet_id)
+                        remaining = []
+                        for update in updates:
+                            if _is_protected_cell(protected, update['range']):
+                                failed_updates.append({'range': update['range'], 'error': 'protected cell'})
+                            else:
+                                remaining.append(update)
+                    except Exception as meta_error:
+                        logger.warning(f"보호 범위 조회 실패: {meta_error}")
+                    
+                    retry_cells = []
+                    if remaining:
+                        try:
+                            retry_result = manager.service.spreadsheets().values().batchUpdate(
+                                spreadsheetId=sheet_id,
+                                body={'valueInputOption': 'USER_ENTERED', 'data': remaining}
+                            ).execute()
+                            updated_cells = retry_result.get('totalUpdatedCells', 0)
+                        except Exception as retry_error:
+                            # 보호 범위 정보가 실제와 다르면 캐시를 버리고 셀 단위로 마지막 재시도
+                            logger.warning(f"일괄 재시도 실패, 단일 셀 업데이트로 재시도: {retry_error}")
+                            _protected_cache.pop(sheet_id, None)
+                            retry_cells = remaining
+                    
+                    for update in retry_cells:
                         try:
                             single_update_body = {
                                 'valueInputOption': 'USER_ENTERED',
@@ -1194,17 +1504,13 @@ def inline_update_direct():
                 else:
                     raise api_error
         
-        # 로컬 데이터 새로고침
-        load_data()
+        # 로컬 데이터에 변경분만 반영
+        fields = {f: v for f, v in data.items() if f in _INLINE_DIRECT_COLUMNS}
+        _apply_local_change(manager, project_code, fields=fields)
         
         # 실시간 알림
         if socketio:
-            socketio.emit('data_updated', {
-                'message': f"프로젝트가 수정되었습니다: {project_code}",
-                'timestamp': datetime.now().isoformat(),
-                'action': 'inline_update',
-                'project_code': project_code
-            })
+            _emit_project_change('inline_update', project_code, f"프로젝트가 수정되었습니다: {project_code}", fields=fields)
         
         # 업데이트 후 새로운 프로젝트 코드 확인 (수식으로 변경될 수 있음)
         try:
@@ -1218,6 +1524,10 @@ def inline_update_direct():
             new_project_code = updated_values[0][0] if updated_values and updated_values[0] else project_code
             
             logger.info(f"업데이트 후 프로젝트 코드: {project_code} -> {new_project_code}")
+            if new_project_code != project_code:
+                # 다음 로드 전까지 이전 코드의 인덱스 행은 쓰지 않고, 새 코드는 이 행으로
+                _row_hints[project_code] = None
+                _row_hints[new_project_code] = row_number
             
         except Exception as e:
             logger.warning(f"새 프로젝트 코드 확인 실패: {e}")
@@ -1248,6 +1558,7 @@ if __name__ == '__main__':
     # 초기 데이터 로드
     logger.info("초기 데이터 로드 중...")
     load_data()
+    start_background_refresh()
     
     # 서버 시작
     port = int(os.getenv('PORT', 8000))
@@ -1,21 +1,26 @@
-import os, json
-from typing import Tuple, Dict, Any
+import os, json, hmac
+from typing import Tuple, Dict, Any, Optional, FrozenSet
 
-_CACHED: Dict[str, Any] = {}
+# (파일 mtime, 파싱 결과) - 파일이 바뀐 경우에만 다시 파싱
+_CACHED: Tuple[Optional[float], Dict[str, Any]] = (None, {})
 
 def _load_creds() -> Dict[str, Any]:
     global _CACHED
-    if _CACHED:
-        return _CACHED
     cred_path = os.getenv("CREDENTIALS_JSON") or os.path.join(os.path.dirname(__file__), "..", "credentials.json")
     cred_path = os.path.abspath(cred_path)
+    try:
+        mtime = os.stat(cred_path).st_mtime
+    except OSError:
+        mtime = None
+    if mtime == _CACHED[0]:
+        return _CACHED[1]
     data: Dict[str, Any] = {}
     try:
         with open(cred_path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except Exception:
         data = {}
-    _CACHED = data
+    _CACHED = (mtime, data)
     return data
 
 def _get_api_key() -> str:
@@ -35,6 +40,17 @@ def _get_admins() -> list:
         return [x.strip().lower() for x in raw.split(",") if x.strip()]
     return [str(x).strip().lower() for x in raw]
 
+# ((ADMIN_EMAILS 값, credentials mtime), 관리자 이메일 집합) - 둘 중 하나가 바뀔 때만 다시 구성
+_ADMIN_SET: Tuple[Optional[tuple], FrozenSet[str]] = (None, frozenset())
+
+def _get_admin_set() -> FrozenSet[str]:
+    global _ADMIN_SET
+    _load_creds()
+    key = (os.getenv("ADMIN_EMAILS", ""), _CACHED[0])
+    if _ADMIN_SET[0] != key:
+        _ADMIN_SET = (key, frozenset(_get_admins()))
+    return _ADMIN_SET[1]
+
 def check_api_key(key: str) -> bool:
     """API 키 검증 (보안 강화)"""
     if not key or len(key.strip()) < 8:  # 최소 8자 이상
@@ -45,10 +61,10 @@ def check_api_key(key: str) -> bool:
         return False
         
     # 상수 시간 비교로 타이밍 공격 방지
-    return len(key) == len(api_key) and key == api_key
+    return hmac.compare_digest(key.encode("utf-8"), api_key.encode("utf-8"))
 
 def is_admin(email: str) -> bool:
-    return email.lower() in set(_get_admins())
+    return email.lower() in _get_admin_set()
 
 def get_user_from_headers(headers) -> Tuple[str, bool]:
     api_key = headers.get("X-API-Key", "")
@@ -1,11 +1,24 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import wraps
 from typing import Dict, List, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _memoize(method):
+    """인스턴스별 결과 캐시 - df가 바뀌면 새 인스턴스가 만들어지고, 같은 인스턴스가 재사용되며
+    current_date가 갱신되면 날짜가 바뀐 시점부터 다시 계산 (키에 current_date 날짜 포함)
+    (반환값을 공유하므로 호출 측에서 수정하지 말 것)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, self.current_date.date(), args, tuple(sorted(kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+    return wrapper
+
 class DataAnalyzer:
     """냉난방기 설치 공사 데이터 분석 클래스"""
     
@@ -18,7 +31,16 @@ class DataAnalyzer:
         """
         self.df = df
         self.current_date = datetime.now()
+        self._cache: Dict[Any, Any] = {}
+    
+    @_memoize
+    def person_indices(self) -> Dict[Any, np.ndarray]:
+        """담당자 -> 행 위치 배열 (처음 등장한 순서), 담당자별 분석에서 공유"""
+        if '담당자' not in self.df.columns:
+            return {}
+        return self.df.groupby('담당자', sort=False, observed=True).indices
     
+    @_memoize
     def get_summary_stats(self) -> Dict[str, Any]:
         """올해 공사확정 기준 요약 통계"""
         try:
@@ -29,22 +51,17 @@ class DataAnalyzer:
                 (pd.to_datetime(self.df['공사 확정'], errors='coerce').dt.year == current_year)
             ]
             
+            # 상태 판정용 마스크는 한 번만 계산해 재사용
+            has_end = this_year_projects['공사 종료'].notna().to_numpy()
+            has_start = this_year_projects['공사 시작'].notna().to_numpy()
             total_projects = len(this_year_projects)
-            completed_projects = len(this_year_projects[this_year_projects['공사 종료'].notna()])
-            in_progress_projects = len(this_year_projects[
-                (this_year_projects['공사 시작'].notna()) & 
-                (this_year_projects['공사 종료'].isna())
-            ])
-            
-            # 금액 관련 통계 (올해 공사확정 기준)
-            total_amount = this_year_projects['총액 2'].fillna(0).sum()
-            total_received = this_year_projects['계약금'].fillna(0).sum() + \
-                           this_year_projects['중도금'].fillna(0).sum() + \
-                           this_year_projects['잔금'].fillna(0).sum()
-            total_outstanding = this_year_projects['미수금'].fillna(0).sum()
+            completed_projects = int(has_end.sum())
+            in_progress_projects = int((has_start & ~has_end).sum())
             
-            # 평균 프로젝트 금액
-            avg_project_amount = this_year_projects['총액 2'].fillna(0).mean()
+            # 금액 관련 통계 (올해 공사확정 기준) - 입금액은 세 컬럼을 한 번에 합산
+            total_amount, avg_project_amount = this_year_projects['총액 2'].fillna(0).agg(['sum', 'mean'])
+            total_received = this_year_projects[['계약금', '중도금', '잔금']].to_numpy(dtype='float64', na_value=0).sum()
+            total_outstanding = this_year_projects['미수금'].fillna(0).sum()
             
             return {
                 'total_projects': total_projects,
@@ -61,79 +78,77 @@ class DataAnalyzer:
             logger.error(f"요약 통계 계산 오류: {str(e)}")
             return {}
     
+    @_memoize
     def get_monthly_sales(self, year: Optional[int] = None) -> pd.DataFrame:
         """월별 매출 현황"""
         try:
             if year is None:
                 year = self.current_date.year
             
-            # 해당 연도 데이터 필터링
-            df_year = self.df[
-                self.df['공사 시작'].dt.year == year
-            ].copy() if '공사 시작' in self.df.columns else self.df.copy()
-            
-            if df_year.empty or '공사 시작' not in df_year.columns:
+            if '공사 시작' not in self.df.columns:
                 return pd.DataFrame()
             
-            # 월별 그룹화
-            df_year['월'] = df_year['공사 시작'].dt.month
-            monthly_stats = df_year.groupby('월').agg({
-                '총액 2': ['sum', 'mean', 'count'],
-                '미수금': 'sum',
-                '순익': 'sum'
-            }).round(0)
+            # 해당 연도 데이터 필터링 (복사 없이 마스크로 한 번만 인덱싱)
+            df_year = self.df[(self.df['공사 시작'].dt.year == year).to_numpy()]
+            
+            if df_year.empty:
+                return pd.DataFrame()
             
-            monthly_stats.columns = ['총매출', '평균금액', '건수', '미수금', '순익']
-            monthly_stats = monthly_stats.reset_index()
+            # 월별 그룹화 (이름 있는 집계로 MultiIndex 컬럼 없이 바로 생성)
+            monthly_stats = df_year.groupby(df_year['공사 시작'].dt.month.rename('월')).agg(
+                총매출=('총액 2', 'sum'),
+                평균금액=('총액 2', 'mean'),
+                건수=('총액 2', 'count'),
+                미수금=('미수금', 'sum'),
+                순익=('순익', 'sum'),
+            ).round(0).reset_index()
             
             return monthly_stats
         except Exception as e:
             logger.error(f"월별 매출 계산 오류: {str(e)}")
             return pd.DataFrame()
     
+    @_memoize
     def get_regional_analysis(self) -> pd.DataFrame:
         """지역별 분석"""
         try:
             if '담당자' not in self.df.columns:
                 return pd.DataFrame()
             
-            regional_stats = self.df.groupby('담당자').agg({
-                '총액 2': ['sum', 'mean', 'count'],
-                '미수금': 'sum',
-                '순익': 'sum',
-                '마진율': 'mean'
-            }).round(2)
-            
-            regional_stats.columns = ['총매출', '평균금액', '건수', '미수금', '총순익', '평균마진율']
-            regional_stats = regional_stats.sort_values('총매출', ascending=False)
-            regional_stats = regional_stats.reset_index()
+            regional_stats = self.df.groupby('담당자', observed=True).agg(
+                총매출=('총액 2', 'sum'),
+                평균금액=('총액 2', 'mean'),
+                건수=('총액 2', 'count'),
+                미수금=('미수금', 'sum'),
+                총순익=('순익', 'sum'),
+                평균마진율=('마진율', 'mean'),
+            ).round(2).sort_values('총매출', ascending=False).reset_index()
             
             return regional_stats
         except Exception as e:
             logger.error(f"지역별 분석 오류: {str(e)}")
             return pd.DataFrame()
     
+    @_memoize
     def get_brand_analysis(self) -> pd.DataFrame:
         """브랜드별 분석"""
         try:
             if '브랜드' not in self.df.columns:
                 return pd.DataFrame()
             
-            brand_stats = self.df.groupby('브랜드').agg({
-                '총액 2': ['sum', 'count'],
-                '순익': 'sum',
-                '마진율': 'mean'
-            }).round(2)
-            
-            brand_stats.columns = ['총매출', '건수', '총순익', '평균마진율']
-            brand_stats = brand_stats.sort_values('총매출', ascending=False)
-            brand_stats = brand_stats.reset_index()
+            brand_stats = self.df.groupby('브랜드', observed=True).agg(
+                총매출=('총액 2', 'sum'),
+                건수=('총액 2', 'count'),
+                총순익=('순익', 'sum'),
+                평균마진율=('마진율', 'mean'),
+            ).round(2).sort_values('총매출', ascending=False).reset_index()
             
             return brand_stats
         except Exception as e:
             logger.error(f"브랜드별 분석 오류: {str(e)}")
             return pd.DataFrame()
     
+    @_memoize
     def get_outstanding_analysis(self) -> Dict[str, Any]:
         """미수금 분석"""
         try:
@@ -143,12 +158,12 @@ class DataAnalyzer:
             if outstanding_df.empty:
                 return {'total_cases': 0, 'total_amount': 0, 'details': pd.DataFrame()}
             
-            # 미수금 기간별 분류
-            current_date = self.current_date
-            outstanding_df['미수금_기간'] = outstanding_df['공사 종료'].apply(
-                lambda x: self._classify_outstanding_period(x, current_date) 
-                if pd.notna(x) else '진행중'
-            )
+            # 미수금 기간별 분류 (종료일 없으면 진행중)
+            days = (pd.Timestamp(self.current_date) - outstanding_df['공사 종료']).dt.days
+            outstanding_df['미수금_기간'] = pd.cut(
+                days, bins=[-np.inf, 30, 60, 90, np.inf],
+                labels=['30일 이내', '31-60일', '61-90일', '90일 초과']
+            ).astype(object).where(days.notna(), '진행중')
             
             # 미수금 요약
             period_summary = outstanding_df.groupby('미수금_기간').agg({
@@ -168,28 +183,13 @@ class DataAnalyzer:
                 'total_amount': outstanding_df['미수금'].sum(),
                 'period_summary': period_summary.reset_index(),
                 'top_outstanding': top_outstanding,
-                'by_person': outstanding_df.groupby('담당자')['미수금'].sum().sort_values(ascending=False).reset_index()
+                'by_person': outstanding_df.groupby('담당자', observed=True)['미수금'].sum().sort_values(ascending=False).reset_index()
             }
         except Exception as e:
             logger.error(f"미수금 분석 오류: {str(e)}")
             return {'total_cases': 0, 'total_amount': 0, 'details': pd.DataFrame()}
     
-    def _classify_outstanding_period(self, completion_date: datetime, current_date: datetime) -> str:
-        """미수금 기간 분류"""
-        if pd.isna(completion_date):
-            return '진행중'
-        
-        days_diff = (current_date - completion_date).days
-        
-        if days_diff <= 30:
-            return '30일 이내'
-        elif days_diff <= 60:
-            return '31-60일'
-        elif days_diff <= 90:
-            return '61-90일'
-        else:
-            return '90일 초과'
-    
+    @_memoize
     def check_missing_data(self) -> Dict[str, Any]:
         """빈 칸 검증 및 누락 데이터 체크"""
         try:
@@ -203,70 +203,60 @@ class DataAnalyzer:
             # 존재하는 중요 필드만 선택
             available_critical_fields = [f for f in critical_fields if f in self.df.columns]
             
-            missing_analysis = {}
+            # 누락 여부는 한 번만 계산하고, 값은 처음부터 Python 기본 타입으로 담음
+            na = self.df[available_critical_fields].isna()
+            na_values = na.to_numpy()
+            missing_counts = na_values.sum(axis=0)
+            total_rows = len(self.df)
             
             # 각 필드별 누락 현황
-            for field in available_critical_fields:
-                missing_count = self.df[field].isna().sum()
-                missing_percentage = (missing_count / len(self.df)) * 100
-                
-                missing_analysis[field] = {
-                    'missing_count': missing_count,
-                    'missing_percentage': missing_percentage
+            missing_analysis = {
+                field: {
+                    'missing_count': int(missing_counts[i]),
+                    'missing_percentage': float(missing_counts[i] / total_rows * 100)
                 }
+                for i, field in enumerate(available_critical_fields)
+            }
             
-            # 영업사원별 누락 현황
+            # 영업사원별 누락 현황 (담당자별 행 위치로 묶어서 한 번에 집계)
             person_missing = {}
             if '담당자' in self.df.columns:
-                for person in self.df['담당자'].dropna().unique():
-                    person_df = self.df[self.df['담당자'] == person]
-                    person_missing_count = 0
-                    person_critical_missing = []
-                    
-                    for field in available_critical_fields:
-                        field_missing = person_df[field].isna().sum()
-                        if field_missing > 0:
-                            person_missing_count += field_missing
-                            person_critical_missing.append({
-                                'field': field,
-                                'missing_count': field_missing,
-                                'projects': person_df[person_df[field].isna()]['프로젝트 코드'].tolist() 
-                                          if '프로젝트 코드' in self.df.columns else []
-                            })
-                    
+                codes = self.df['프로젝트 코드'].to_numpy() if '프로젝트 코드' in self.df.columns else None
+                for person, pos in self.person_indices().items():
+                    person_na = na_values[pos]
+                    counts = person_na.sum(axis=0)
                     person_missing[person] = {
-                        'total_missing': person_missing_count,
-                        'critical_missing': person_critical_missing
+                        'total_missing': int(counts.sum()),
+                        'critical_missing': [{
+                            'field': field,
+                            'missing_count': int(counts[i]),
+                            'projects': codes[pos[person_na[:, i]]].tolist() if codes is not None else []
+                        } for i, field in enumerate(available_critical_fields) if counts[i] > 0]
                     }
             
-            # 가장 누락이 많은 프로젝트들
-            self.df['missing_count'] = self.df[available_critical_fields].isna().sum(axis=1)
-            top_missing_projects = self.df.nlargest(20, 'missing_count')[
-                ['프로젝트 코드', '담당자', '현장 주소', 'missing_count'] + 
+            # 가장 누락이 많은 프로젝트들 (self.df에 컬럼을 추가하지 않음 - 공유 DataFrame)
+            # 전체 정렬 대신 부분 선택 후 상위 k개만 정렬 (동점은 앞 행 우선 - nlargest와 동일)
+            row_missing = na_values.sum(axis=1)
+            k = min(20, len(row_missing))
+            top = np.array([], dtype=np.intp)
+            if k:
+                kth = np.partition(row_missing, -k)[-k]
+                above = np.flatnonzero(row_missing > kth)
+                ties = np.flatnonzero(row_missing == kth)[:k - len(above)]
+                top = np.concatenate([above, ties])
+                top = top[np.argsort(-row_missing[top], kind='stable')]
+            top_cols = ['프로젝트 코드', '담당자', '현장 주소'] + \
                 [f for f in available_critical_fields[:5] if f not in ['프로젝트 코드', '담당자', '현장 주소']]
-            ].copy() if 'missing_count' in self.df.columns else pd.DataFrame()
-            
-            # numpy 타입을 Python 기본 타입으로 변환하는 함수
-            def convert_numpy_types(obj):
-                if hasattr(obj, 'item'):  # numpy scalar
-                    return obj.item()
-                elif hasattr(obj, 'tolist'):  # numpy array
-                    return obj.tolist()
-                elif isinstance(obj, dict):
-                    return {k: convert_numpy_types(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_numpy_types(item) for item in obj]
-                else:
-                    return obj
+            top_missing_projects = self.df.iloc[top][top_cols]
+            top_missing_projects.insert(3, 'missing_count', row_missing[top])
             
             result = {
-                'field_analysis': convert_numpy_types(missing_analysis),
-                'person_analysis': convert_numpy_types(person_missing),
+                'field_analysis': missing_analysis,
+                'person_analysis': person_missing,
                 'top_missing_projects': top_missing_projects.to_dict('records') if not top_missing_projects.empty else [],
-                'total_critical_fields': int(len(available_critical_fields)),
+                'total_critical_fields': len(available_critical_fields),
                 'overall_missing_rate': float((
-                    self.df[available_critical_fields].isna().sum().sum() / 
-                    (len(self.df) * len(available_critical_fields)) * 100
+                    missing_counts.sum() / (total_rows * len(available_critical_fields)) * 100
                 ) if available_critical_fields else 0)
             }
             
@@ -276,6 +266,7 @@ class DataAnalyzer:
             logger.error(f"누락 데이터 체크 오류: {str(e)}")
             return {}
     
+    @_memoize
     def get_completion_timeline(self) -> pd.DataFrame:
         """공사 완료 timeline 분석"""
         try:
@@ -321,8 +312,22 @@ def test_data_analyzer():
     load_dotenv()
     
     try:
-        # 로컬 엑셀 파일로 테스트
-        df = pd.read_excel('data/아이티 공사 현황.xlsx', sheet_name='공사 현황')
+        # 로컬 엑셀 파일로 테스트 (엑셀보다 최신인 parquet 사이드카가 있으면 재사용)
+        excel_path = 'data/아이티 공사 현황.xlsx'
+        cache_path = excel_path + '.parquet'
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+            df = pd.read_parquet(cache_path)
+        else:
+            try:
+                import python_calamine  # noqa: F401 (있으면 Rust 파서 사용)
+                engine = 'calamine'
+            except ImportError:
+                engine = None
+            df = pd.read_excel(excel_path, sheet_name='공사 현황', engine=engine)
+            try:
+                df.to_parquet(cache_path)
+            except Exception as e:
+                print(f"parquet 캐시 저장 실패: {e}")
         analyzer = DataAnalyzer(df)
         
         print("=== 전체 요약 통계 ===")
@@ -1,18 +1,201 @@
 import os
+import re
+import functools
+import glob
+import hashlib
+import json
+import threading
+import numpy as np
 import pandas as pd
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.errors import HttpError
 from datetime import datetime
 import logging
+import time
+from types import MappingProxyType
+
+try:
+    import pyarrow  # noqa: F401
+    _TEXT_DTYPE = 'string[pyarrow]'  # 설치되어 있으면 Arrow 기반 문자열 컬럼
+except ImportError:
+    _TEXT_DTYPE = 'string'
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 쓰기 요청 재시도 대상 (충돌/일시적 서버 오류)
+RETRY_STATUSES = {409, 429, 500, 502, 503, 504}
+MAX_WRITE_RETRIES = 4
+# 행 추가(INSERT_ROWS)는 멱등이 아니므로 반영되지 않은 것이 확실한 상태만 그대로 재시도
+# (5xx는 이미 추가됐을 수 있어 A열에서 코드를 확인한 뒤에만 재시도)
+APPEND_RETRY_STATUSES = {409, 429}
+
+# 숫자 컬럼 (함수 계산 결과 포함)
+_NUMERIC_COLUMNS = ('총액 1', '총액 2', '총액2', '계약금', '중도금', '잔금',
+                    '미수금', '미수금W', '제품대', '도급비', '자재비', '기타비', '순익', '마진율')
+
+# 시트 값 읽기 방식 - UNFORMATTED_VALUE면 숫자/불린 셀이 JSON 숫자/불린으로 와서 숫자 정리 과정을 건너뜀
+# (기본값은 FORMATTED_VALUE: 퍼센트 셀은 15%→0.15, '-' 표시 음수는 음수로 바뀌는 등 값 의미가 달라지므로 확인 후 전환)
+SHEET_VALUE_RENDER = os.getenv('SHEET_VALUE_RENDER', 'FORMATTED_VALUE').upper()
+
+# 숫자 컬럼 정리: 쉼표, 원화기호, '-', 공백을 한 번에 제거
+_NUM_CLEAN_RE = re.compile(r'[,￦₩\-\s]')
+
+# 값 종류가 적은 텍스트 컬럼 - 전처리 끝에 category로 변환 (메모리 절감, groupby/필터 키)
+_CATEGORICAL_COLUMNS = ('사업자', '담당자', '공사 구분', '기계 분류', '브랜드', '도급 구분', '시공자')
+
+# 프로젝트 코드의 순번 (G0001-IT → 0001: 첫 글자 다음 숫자, 첫 '-' 앞까지)
+_CODE_NUM_RE = re.compile(r'^.(\d+)-')
+
+# 시트/입력 폼의 기본 날짜 형식 (이 형식이면 추론 없이 빠른 경로로 파싱)
+_SHEET_DATE_FORMAT = '%Y-%m-%d'
+
+def _parse_sheet_dates(s):
+    """기본 형식으로 먼저 파싱하고, 다른 형식으로 적힌 값만 형식 추론으로 다시 파싱"""
+    parsed = pd.to_datetime(s, format=_SHEET_DATE_FORMAT, errors='coerce', cache=True)
+    leftover = parsed.isna() & s.notna() & (s.astype(str).str.strip() != '')
+    if leftover.any():
+        parsed[leftover] = pd.to_datetime(s[leftover], errors='coerce', cache=True)
+    return parsed
+
+# 시트 데이터 캐시 - 드라이브 수정 시각(modifiedTime)이 같으면 재조회/전처리 생략
+# (프로세스 내 dict + 프로세스 간 공유용 parquet/메타 JSON)
+_SHEET_CACHE_DIR = os.getenv('SHEET_CACHE_DIR') or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), '.cache', 'sheets')
+_sheet_cache = {}      # (sheet_id, range_name) -> (revision, df)
+_sheet_cache_gen = {}  # sheet_id -> 무효화 횟수 (무효화 전에 시작된 조회 결과는 저장하지 않음)
+_sheet_cache_lock = threading.Lock()
+
+def _sheet_cache_path(sheet_id, range_name):
+    digest = hashlib.md5(range_name.encode('utf-8')).hexdigest()[:8]
+    return os.path.join(_SHEET_CACHE_DIR, f"{sheet_id}_{digest}")
+
+def invalidate_sheet_cache(sheet_id):
+    """쓰기 직후 호출 - 수정 시각 반영이 늦어도 다음 조회는 시트에서 새로 읽음"""
+    with _sheet_cache_lock:
+        _sheet_cache_gen[sheet_id] = _sheet_cache_gen.get(sheet_id, 0) + 1
+        for key in [k for k in _sheet_cache if k[0] == sheet_id]:
+            del _sheet_cache[key]
+    for path in glob.glob(os.path.join(_SHEET_CACHE_DIR, f"{sheet_id}_*")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _load_cached_sheet(sheet_id, range_name, revision):
+    """같은 수정 시각의 캐시 DataFrame (메모리 → 디스크 순), 없으면 None"""
+    key = (sheet_id, range_name)
+    with _sheet_cache_lock:
+        hit = _sheet_cache.get(key)
+    if hit and hit[0] == revision:
+        return hit[1]
+    
+    base = _sheet_cache_path(sheet_id, range_name)
+    try:
+        with open(base + '.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('revision') != revision or meta.get('range') != range_name:
+            return None
+        df = pd.read_parquet(base + '.parquet')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"시트 캐시 읽기 실패: {e}")
+        return None
+    
+    with _sheet_cache_lock:
+        _sheet_cache[key] = (revision, df)
+    return df
+
+def _store_cached_sheet(sheet_id, range_name, revision, gen, df):
+    with _sheet_cache_lock:
+        if _sheet_cache_gen.get(sheet_id, 0) != gen:
+            return
+        _sheet_cache[(sheet_id, range_name)] = (revision, df)
+    
+    base = _sheet_cache_path(sheet_id, range_name)
+    try:
+        os.makedirs(_SHEET_CACHE_DIR, exist_ok=True)
+        df.to_parquet(base + '.parquet')
+        with open(base + '.json', 'w', encoding='utf-8') as f:
+            json.dump({'sheet_id': sheet_id, 'range': range_name, 'revision': revision,
+                       'rows': len(df), 'saved_at': datetime.now().isoformat()}, f, ensure_ascii=False)
+    except Exception as e:
+        logger.warning(f"시트 캐시 저장 실패: {e}")
+
+@functools.lru_cache(maxsize=8)
+def _load_credentials(credentials_file, mtime, scopes):
+    """서비스 계정 자격증명 - 키 파일이 그대로면 매니저끼리 공유 (발급받은 액세스 토큰도 재사용)"""
+    return ServiceAccountCredentials.from_service_account_file(credentials_file, scopes=list(scopes))
+
+@functools.lru_cache(maxsize=None)
+def _discovery_doc(name, version):
+    """패키지에 포함된 API discovery 문서 - 서비스 객체를 만들 때마다 파일을 다시 읽지 않음"""
+    try:
+        from googleapiclient.discovery_cache import get_static_doc
+    except ImportError:
+        return None
+    return get_static_doc(name, version)
+
+def _build_service(name, version, creds):
+    """서비스 객체 생성 (httplib2 연결은 스레드 간 공유 불가라 객체는 매니저마다 따로)"""
+    doc = _discovery_doc(name, version)
+    if doc is None:
+        return build(name, version, credentials=creds, cache_discovery=False)
+    return build_from_document(doc, credentials=creds)
+
 class GoogleSheetsManager:
     """구글 시트 연동 관리 클래스"""
     
-    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+    SCOPES = [
+        'https://www.googleapis.com/auth/spreadsheets',
+        'https://www.googleapis.com/auth/drive.metadata.readonly',  # 수정 시각 조회 (캐시 키)
+    ]
+    
+    # 시트 컬럼 문자 -> 컬럼명 (읽기 전용, 호출마다 새로 만들지 않음)
+    COLUMN_MAPPING = MappingProxyType({
+        'A': '프로젝트 코드',
+        'B': '사업자', 
+        'C': '담당자',
+        'D': '거래처',
+        'E': '현장 주소',
+        'F': '공사 구분',
+        'G': '기계 분류',
+        'H': '브랜드',
+        'I': '공사 시작',
+        'J': '공사 종료',
+        'K': '공사 내용',
+        'L': '도급 구분',
+        'M': '시공자',
+        'N': '현장 담당자',
+        'O': '담당자 연락처',
+        'P': '담당자 이메일',
+        'Q': '총액 1',
+        'R': '부가세',
+        'S': '총액 2',
+        'T': '계약금',
+        'U': '중도금',
+        'V': '잔금',
+        'W': '미수금',
+        'X': '계산서',
+        'Y': '수금 날짜',
+        'Z': '수금 확인',
+        'AA': '제품대',
+        'AB': '도급비',
+        'AC': '자재비',
+        'AD': '기타비',
+        'AE': '순익',
+        'AF': '마진율',
+        'AG': '비고',
+        'AH': '계약금 입금자명',
+        'AI': '중도금 입금자명',
+        'AJ': '잔금 입금자명',
+        'AK': '견적서 및 계약서 폴더 경로',
+        'AL': '공사 확정',
+        'AM': 'Airtable Record ID'
+    })
     
     def __init__(self, credentials_file='credentials.json'):
         """
@@ -23,6 +206,9 @@ class GoogleSheetsManager:
         """
         self.credentials_file = credentials_file
         self.service = None
+        self.service_account_email = None
+        self._creds = None
+        self._drive = None  # 드라이브 API 서비스 (사용 불가로 확인되면 False)
         self._authenticate()
     
     def _authenticate(self):
@@ -34,19 +220,65 @@ class GoogleSheetsManager:
             )
         
         try:
-            # 서비스 계정 자격증명 로드
-            creds = ServiceAccountCredentials.from_service_account_file(
-                self.credentials_file, scopes=self.SCOPES
+            # 서비스 계정 자격증명 로드 (키 파일 수정 시각 기준으로 캐시)
+            creds = _load_credentials(
+                self.credentials_file, os.path.getmtime(self.credentials_file), tuple(self.SCOPES)
             )
             
+            self._creds = creds
+            self.service_account_email = creds.service_account_email
+            
             # 서비스 객체 생성
-            self.service = build('sheets', 'v4', credentials=creds)
+            self.service = _build_service('sheets', 'v4', creds)
             logger.info("구글 시트 API 인증 완료 (서비스 계정)")
             
         except Exception as e:
             logger.error(f"구글 API 인증 실패: {str(e)}")
             raise
     
+    def _batch_get(self, sheet_id, ranges, value_render='FORMATTED_VALUE', major_dimension='ROWS'):
+        """
+        여러 범위를 batchGet 한 번(HTTPS 왕복 1회)으로 읽기
+        
+        Args:
+            sheet_id: 구글 시트 ID
+            ranges: A1 범위 리스트
+            value_render: FORMATTED_VALUE(표시 문자열) 또는 UNFORMATTED_VALUE(숫자/불린 원값)
+            major_dimension: ROWS(행 리스트) 또는 COLUMNS(열 리스트 - 한 열 범위는 값 리스트 하나)
+            
+        Returns:
+            list: 범위 순서대로 각 범위의 values (빈 범위는 [])
+        """
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=sheet_id,
+            ranges=list(ranges),
+            majorDimension=major_dimension,
+            valueRenderOption=value_render,  # 함수 계산 결과 (기본: 포맷된 값)
+            dateTimeRenderOption='FORMATTED_STRING'  # 날짜 포맷된 문자열로
+        ).execute()
+        return [vr.get('values', []) for vr in result.get('valueRanges', [])]
+    
+    def _get_revision(self, sheet_id):
+        """스프레드시트의 드라이브 수정 시각 - 조회할 수 없으면 None (캐시 없이 읽음)"""
+        if self._drive is False:
+            return None
+        try:
+            if self._drive is None:
+                self._drive = _build_service('drive', 'v3', self._creds)
+            meta = self._drive.files().get(
+                fileId=sheet_id, fields='modifiedTime', supportsAllDrives=True
+            ).execute()
+            return meta.get('modifiedTime')
+        except HttpError as e:
+            if e.resp.status in (401, 403):
+                # 드라이브 API 미사용 설정/권한 없음 → 이 매니저에서는 더 시도하지 않음
+                self._drive = False
+            logger.warning(f"시트 수정 시각 조회 실패, 캐시 없이 조회: {str(e)}")
+            return None
+        except Exception as e:
+            logger.warning(f"시트 수정 시각 조회 실패, 캐시 없이 조회: {str(e)}")
+            return None
+    
     def get_sheet_data(self, sheet_id, range_name='공사 현황!A:AM'):
         """
         구글 시트에서 데이터 가져오기 (에러 처리 강화)
@@ -56,21 +288,26 @@ class GoogleSheetsManager:
             range_name: 데이터 범위
             
         Returns:
-            pandas.DataFrame: 시트 데이터
+            pandas.DataFrame: 시트 데이터 (캐시 적중 시 공유 객체이므로 수정하지 말 것)
         """
         try:
             if not sheet_id:
                 raise ValueError("시트 ID가 제공되지 않았습니다.")
             
-            # 시트 데이터 가져오기 (함수 계산 결과 포함)
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=sheet_id,
-                range=range_name,
-                valueRenderOption='FORMATTED_VALUE',  # 함수 계산 결과를 포맷된 값으로
-                dateTimeRenderOption='FORMATTED_STRING'  # 날짜 포맷된 문자열로
-            ).execute()
+            # 시트가 바뀌지 않았으면 이전 결과 재사용 (읽기 방식별로 따로 캐시)
+            render = SHEET_VALUE_RENDER
+            cache_range = range_name if render == 'FORMATTED_VALUE' else f"{range_name}#{render}"
+            revision = self._get_revision(sheet_id)
+            if revision:
+                cached = _load_cached_sheet(sheet_id, cache_range, revision)
+                if cached is not None:
+                    logger.info(f"시트 변경 없음({revision}), 캐시된 {len(cached)}행 사용")
+                    return cached
+            with _sheet_cache_lock:
+                gen = _sheet_cache_gen.get(sheet_id, 0)
             
-            values = result.get('values', [])
+            # 시트 데이터 가져오기 (함수 계산 결과 포함)
+            values = self._batch_get(sheet_id, [range_name], render)[0]
             
             if not values:
                 logger.warning("시트에 데이터가 없습니다.")
@@ -80,12 +317,23 @@ class GoogleSheetsManager:
                 logger.warning("시트에 헤더만 있고 데이터가 없습니다.")
                 return pd.DataFrame(columns=values[0] if values else [])
             
-            # DataFrame 생성
+            # DataFrame 생성 (시트 값은 문자열 dtype으로 - 이후 .str 연산이 셀마다 str()을 부르지 않도록)
             df = pd.DataFrame(values[1:], columns=values[0])
+            if render == 'UNFORMATTED_VALUE':
+                # 숫자 컬럼은 이미 숫자(빈 칸만 '') → 바로 float64로, 나머지만 문자열 dtype
+                num_cols = [c for c in _NUMERIC_COLUMNS if c in df.columns]
+                df = df.astype({c: _TEXT_DTYPE for c in df.columns if c not in num_cols})
+                for col in num_cols:
+                    df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+            else:
+                df = df.astype(_TEXT_DTYPE)
             
             # 데이터 전처리
             df = self._preprocess_data(df)
             
+            if revision:
+                _store_cached_sheet(sheet_id, cache_range, revision, gen, df)
+            
             logger.info(f"구글 시트에서 {len(df)}행의 데이터를 가져왔습니다.")
             return df
             
@@ -104,7 +352,7 @@ class GoogleSheetsManager:
             raise
     
     def _preprocess_data(self, df):
-        """데이터 전처리"""
+        """데이터 전처리 (이미 변환된 타입의 컬럼은 건너뛰므로 정리된 df에 다시 적용해도 비용이 작음)"""
         # 빈 행 제거
         df = df.dropna(how='all')
         
@@ -120,25 +368,29 @@ class GoogleSheetsManager:
         # 날짜 컬럼 처리
         date_columns = ['공사 시작', '공사 종료', '수금 날짜', '공사 확정']
         for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = _parse_sheet_dates(df[col])
         
-        # 숫자 컬럼 처리 (함수 계산 결과 포함)
-        numeric_columns = ['총액 1', '총액 2', '총액2', '계약금', '중도금', '잔금', 
-                          '미수금', '미수금W', '제품대', '도급비', '자재비', '기타비', '순익', '마진율']
-        for col in numeric_columns:
-            if col in df.columns:
+        # 숫자 컬럼 처리 (함수 계산 결과 포함, 이미 숫자로 읽은 컬럼은 건너뜀)
+        for col in _NUMERIC_COLUMNS:
+            if col in df.columns and not pd.api.types.is_float_dtype(df[col]):
                 # 쉼표, 원화기호, 공백 제거 후 숫자 변환 (구글 시트 포맷된 값 처리)
-                df[col] = df[col].astype(str).str.replace(',', '').str.replace('￦', '').str.replace('₩', '').str.replace('-', '').str.strip()
-                # 빈 문자열이나 'nan'을 NaN으로 처리
-                df[col] = df[col].replace(['', 'nan', 'None'], pd.NA)
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+                # 빈 문자열/결측은 errors='coerce'로 NaN 처리 (시트에서 읽은 컬럼은 이미 string이라 변환 없음)
+                cleaned = df[col].astype('string').str.replace(_NUM_CLEAN_RE, '', regex=True)
+                # nullable Float64 대신 기존과 같은 float64(NaN)로
+                df[col] = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
         
         # 불린 컬럼 처리
         boolean_columns = ['부가세', '수금 확인']
         for col in boolean_columns:
-            if col in df.columns:
-                df[col] = df[col].map({'TRUE': True, 'FALSE': False}).fillna(False)
+            if col in df.columns and not pd.api.types.is_bool_dtype(df[col]):
+                # 'TRUE'(대소문자 무관)만 True, 나머지/빈 값은 False
+                df[col] = (df[col].astype('string').str.upper() == 'TRUE').fillna(False).to_numpy(dtype=bool)
+        
+        # 반복 값이 많은 텍스트 컬럼은 정수 코드 기반 category로
+        for col in _CATEGORICAL_COLUMNS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
         
         return df
     
@@ -170,30 +422,6 @@ class GoogleSheetsManager:
             logger.error(f"구글 시트 연결 테스트 오류: {str(e)}")
             return False
 
-def test_google_sheets_connection():
-    """구글 시트 연결 테스트 함수"""
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    sheet_id = os.getenv('GOOGLE_SHEET_ID')
-    if not sheet_id:
-        print("GOOGLE_SHEET_ID가 .env 파일에 설정되지 않았습니다.")
-        return
-    
-    try:
-        manager = GoogleSheetsManager()
-        if manager.validate_connection(sheet_id):
-            print("✅ 구글 시트 연결 성공!")
-            
-            # 샘플 데이터 가져오기
-            df = manager.get_sheet_data(sheet_id)
-            print(f"📊 데이터 크기: {df.shape}")
-            print(f"📋 컬럼 수: {len(df.columns)}")
-        else:
-            print("❌ 구글 시트 연결 실패")
-    except Exception as e:
-        print(f"❌ 오류 발생: {str(e)}")
-
     def append_row(self, sheet_id, values, range_name='공사 현황!A:AM'):
         """
         구글 시트에 새 행 추가
@@ -206,26 +434,57 @@ def test_google_sheets_connection():
         Returns:
             dict: 추가 결과
         """
+        body = {
+            'values': [values]
+        }
+        request = self.service.spreadsheets().values().append(
+            spreadsheetId=sheet_id,
+            range=range_name,
+            valueInputOption='USER_ENTERED',
+            insertDataOption='INSERT_ROWS',
+            body=body
+        )
+        
+        for attempt in range(MAX_WRITE_RETRIES):
+            try:
+                result = request.execute()
+                logger.info(f"새 행 추가 성공: {result.get('updates', {}).get('updatedRows', 0)}행")
+                return result
+            except HttpError as e:
+                if e.resp.status not in RETRY_STATUSES or attempt == MAX_WRITE_RETRIES - 1:
+                    logger.error(f"행 추가 오류: {str(e)}")
+                    raise
+                if e.resp.status not in APPEND_RETRY_STATUSES:
+                    applied = self._appended_row(sheet_id, values, range_name)
+                    if applied is None:
+                        logger.error(f"행 추가 오류 (반영 여부 확인 불가): {str(e)}")
+                        raise
+                    if applied:
+                        logger.warning(f"행 추가 응답 실패({e.resp.status})였으나 이미 반영됨: {applied}행")
+                        sheet = range_name.split('!')[0]
+                        return {'updates': {'updatedRange': f'{sheet}!A{applied}:AM{applied}', 'updatedRows': 1}}
+                logger.warning(f"행 추가 재시도 ({e.resp.status}, 시도 {attempt + 1}/{MAX_WRITE_RETRIES})")
+                time.sleep(0.2 * (2 ** attempt))  # 지수 백오프
+            except Exception as e:
+                logger.error(f"행 추가 오류: {str(e)}")
+                raise
+    
+    def _appended_row(self, sheet_id, values, range_name):
+        """실패 응답을 받은 행 추가가 실제로 반영됐는지 A열의 프로젝트 코드로 확인
+        (반영된 행 번호, 없으면 0, 코드가 없거나 조회 실패로 알 수 없으면 None)"""
+        code = str(values[0]).strip() if values else ''
+        if not code:
+            return None
         try:
-            body = {
-                'values': [values]
-            }
-            
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=sheet_id,
-                range=range_name,
-                valueInputOption='USER_ENTERED',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
-            logger.info(f"새 행 추가 성공: {result.get('updates', {}).get('updatedRows', 0)}행")
-            return result
-            
+            column = self._batch_get(sheet_id, [f"{range_name.split('!')[0]}!A:A"])[0]
         except Exception as e:
-            logger.error(f"행 추가 오류: {str(e)}")
-            raise
-    
+            logger.error(f"행 추가 반영 확인 실패: {str(e)}")
+            return None
+        try:
+            return column.index([code]) + 1
+        except ValueError:
+            return 0
+
     def update_row(self, sheet_id, row_number, values, range_name='공사 현황!A{row}:AM{row}'):
         """
         구글 시트의 특정 행 업데이트
@@ -274,18 +533,13 @@ def test_google_sheets_connection():
             int: 행 번호 (없으면 None)
         """
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=sheet_id,
-                range=range_name
-            ).execute()
-            
-            values = result.get('values', [])
+            values = self._batch_get(sheet_id, [range_name])[0]
             
-            for i, row in enumerate(values):
-                if row and len(row) > 0 and row[0] == project_code:
-                    return i + 1  # 1부터 시작하는 행 번호
-            
-            return None
+            # 한 열 범위의 각 행은 [값] 또는 [] - 리스트 비교로 C 수준에서 첫 일치 위치 검색
+            try:
+                return values.index([project_code]) + 1  # 1부터 시작하는 행 번호
+            except ValueError:
+                return None
             
         except Exception as e:
             logger.error(f"행 찾기 오류: {str(e)}")
@@ -303,30 +557,20 @@ def test_google_sheets_connection():
             str: 새 프로젝트 코드
         """
         try:
-            # 기존 데이터에서 해당 지역의 최대 번호 찾기
-            df = self.get_sheet_data(sheet_id)
+            # 전체 시트 대신 A열(프로젝트 코드)만 읽어 해당 지역의 최대 번호 찾기
+            # (COLUMNS 방향이면 행마다 리스트로 감싸지 않은 값 리스트 하나로 받음)
+            columns = self._batch_get(sheet_id, ['공사 현황!A:A'], major_dimension='COLUMNS')[0]
+            column = columns[0] if columns else []
             
-            if df.empty or '프로젝트 코드' not in df.columns:
+            if not column or column[0] != '프로젝트 코드':
                 return f"G0001-{region_code}"
             
-            # 해당 지역 코드가 포함된 프로젝트 코드 찾기
-            region_projects = df[df['프로젝트 코드'].str.contains(f'-{region_code}', na=False)]
+            # 해당 지역 코드가 포함된 프로젝트 코드에서 번호를 한 번에 추출해 최대값 찾기
+            codes = pd.Series(column[1:], dtype=object)
+            codes = codes[codes.str.contains(f'-{region_code}', regex=False)]
+            max_num = pd.to_numeric(codes.str.extract(_CODE_NUM_RE, expand=False), errors='coerce').max()
             
-            if region_projects.empty:
-                return f"G0001-{region_code}"
-            
-            # 번호 추출 및 최대값 찾기
-            max_num = 0
-            for code in region_projects['프로젝트 코드']:
-                try:
-                    # G0001-IT 형태에서 숫자 부분 추출
-                    num_part = code.split('-')[0][1:]  # G 제거 후 숫자 부분
-                    num = int(num_part)
-                    max_num = max(max_num, num)
-                except (ValueError, IndexError):
-                    continue
-            
-            next_num = max_num + 1
+            next_num = 1 if pd.isna(max_num) else int(max_num) + 1
             return f"G{next_num:04d}-{region_code}"
             
         except Exception as e:
@@ -335,47 +579,31 @@ def test_google_sheets_connection():
     
     def get_column_mapping(self):
         """컬럼 매핑 정보 반환"""
-        return {
-            'A': '프로젝트 코드',
-            'B': '사업자', 
-            'C': '담당자',
-            'D': '거래처',
-            'E': '현장 주소',
-            'F': '공사 구분',
-            'G': '기계 분류',
-            'H': '브랜드',
-            'I': '공사 시작',
-            'J': '공사 종료',
-            'K': '공사 내용',
-            'L': '도급 구분',
-            'M': '시공자',
-            'N': '현장 담당자',
-            'O': '담당자 연락처',
-            'P': '담당자 이메일',
-            'Q': '총액 1',
-            'R': '부가세',
-            'S': '총액 2',
-            'T': '계약금',
-            'U': '중도금',
-            'V': '잔금',
-            'W': '미수금',
-            'X': '계산서',
-            'Y': '수금 날짜',
-            'Z': '수금 확인',
-            'AA': '제품대',
-            'AB': '도급비',
-            'AC': '자재비',
-            'AD': '기타비',
-            'AE': '순익',
-            'AF': '마진율',
-            'AG': '비고',
-            'AH': '계약금 입금자명',
-            'AI': '중도금 입금자명',
-            'AJ': '잔금 입금자명',
-            'AK': '견적서 및 계약서 폴더 경로',
-            'AL': '공사 확정',
-            'AM': 'Airtable Record ID'
-        }
+        return self.COLUMN_MAPPING
+
+def test_google_sheets_connection():
+    """구글 시트 연결 테스트 함수"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    sheet_id = os.getenv('GOOGLE_SHEET_ID')
+    if not sheet_id:
+        print("GOOGLE_SHEET_ID가 .env 파일에 설정되지 않았습니다.")
+        return
+    
+    try:
+        manager = GoogleSheetsManager()
+        if manager.validate_connection(sheet_id):
+            print("✅ 구글 시트 연결 성공!")
+            
+            # 샘플 데이터 가져오기
+            df = manager.get_sheet_data(sheet_id)
+            print(f"📊 데이터 크기: {df.shape}")
+            print(f"📋 컬럼 수: {len(df.columns)}")
+        else:
+            print("❌ 구글 시트 연결 실패")
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
 
 if __name__ == "__main__":
     test_google_sheets_connection()
\ No newline at end of file
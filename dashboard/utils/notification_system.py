@@ -1,5 +1,7 @@
 import smtplib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import schedule
 import time
 import logging
@@ -9,7 +11,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import os
 from dotenv import load_dotenv
-import json
+import orjson
+import jinja2
+from concurrent.futures import ThreadPoolExecutor
 
 # 환경 변수 로드
 load_dotenv()
@@ -18,6 +22,17 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 이메일 템플릿 (모듈 로드 시 한 번만 컴파일, HTML만 자동 이스케이프)
+_EMAIL_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates', 'email')),
+    autoescape=jinja2.select_autoescape(['html']),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_EMAIL_TEXT_TEMPLATE = _EMAIL_ENV.get_template('missing_data.txt')
+_EMAIL_HTML_TEMPLATE = _EMAIL_ENV.get_template('missing_data.html')
+
 class NotificationSystem:
     """알림 시스템 클래스"""
     
@@ -29,8 +44,13 @@ class NotificationSystem:
         self.email_username = os.getenv('EMAIL_USERNAME')
         self.email_password = os.getenv('EMAIL_PASSWORD')
         
-        # 슬랙 설정
+        # 슬랙 설정 (웹훅 호출은 keep-alive 세션으로 TLS 연결 재사용)
         self.slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=2, pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        ))
         
         # 알림 설정
         self.notification_interval = int(os.getenv('NOTIFICATION_INTERVAL_HOURS', 24))
@@ -48,8 +68,8 @@ class NotificationSystem:
         # 여기서는 환경 변수에서 JSON 형태로 로드
         sales_emails_json = os.getenv('SALES_EMAILS', '{}')
         try:
-            return json.loads(sales_emails_json)
-        except json.JSONDecodeError:
+            return orjson.loads(sales_emails_json)
+        except orjson.JSONDecodeError:
             logger.warning("영업사원 이메일 설정을 불러올 수 없습니다. 기본값 사용.")
             return {
                 '양곡': 'yangkok@company.com',
@@ -59,41 +79,77 @@ class NotificationSystem:
                 '일산': 'ilsan@company.com'
             }
     
-    def send_email(self, to_email: str, subject: str, body: str, html_body: str = None) -> bool:
-        """이메일 발송"""
-        try:
-            if not self.email_username or not self.email_password:
-                logger.error("이메일 계정 정보가 설정되지 않았습니다.")
-                return False
-            
-            # MIME 메시지 생성
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.email_username
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # 텍스트 버전
-            text_part = MIMEText(body, 'plain', 'utf-8')
-            msg.attach(text_part)
-            
-            # HTML 버전 (있는 경우)
-            if html_body:
-                html_part = MIMEText(html_body, 'html', 'utf-8')
-                msg.attach(html_part)
-            
-            # SMTP 서버 연결 및 발송
-            server = smtplib.SMTP(self.email_host, self.email_port)
-            server.starttls()
-            server.login(self.email_username, self.email_password)
-            server.send_message(msg)
-            server.quit()
-            
-            logger.info(f"이메일 발송 성공: {to_email}")
-            return True
+    def _build_email(self, to_email: str, subject: str, body: str, html_body: str = None) -> MIMEMultipart:
+        """MIME 메시지 생성 (텍스트 + 선택적 HTML)"""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = self.email_username
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        # 텍스트 버전
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+        
+        # HTML 버전 (있는 경우)
+        if html_body:
+            msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+        
+        return msg
+    
+    def _connect_smtp(self) -> smtplib.SMTP:
+        """SMTP 연결 + STARTTLS + 로그인"""
+        server = smtplib.SMTP(self.email_host, self.email_port)
+        server.starttls()
+        server.login(self.email_username, self.email_password)
+        return server
+    
+    def send_emails_bulk(self, messages: List[tuple]) -> List[bool]:
+        """
+        여러 이메일을 SMTP 연결 하나로 발송 (TLS 핸드셰이크/로그인은 한 번만)
+        
+        Args:
+            messages: (to_email, subject, body, html_body) 튜플 리스트
             
+        Returns:
+            List[bool]: 메시지별 발송 성공 여부
+        """
+        results = [False] * len(messages)
+        if not messages:
+            return results
+        if not self.email_username or not self.email_password:
+            logger.error("이메일 계정 정보가 설정되지 않았습니다.")
+            return results
+        
+        try:
+            server = self._connect_smtp()
         except Exception as e:
-            logger.error(f"이메일 발송 실패: {to_email}, 오류: {str(e)}")
-            return False
+            logger.error(f"이메일 서버 연결 실패: {str(e)}")
+            return results
+        
+        try:
+            for i, (to_email, subject, body, html_body) in enumerate(messages):
+                msg = self._build_email(to_email, subject, body, html_body)
+                try:
+                    try:
+                        server.send_message(msg)
+                    except smtplib.SMTPServerDisconnected:
+                        # 서버가 연결을 끊었으면 한 번만 다시 연결해서 재시도
+                        server = self._connect_smtp()
+                        server.send_message(msg)
+                    results[i] = True
+                    logger.info(f"이메일 발송 성공: {to_email}")
+                except Exception as e:
+                    logger.error(f"이메일 발송 실패: {to_email}, 오류: {str(e)}")
+        finally:
+            try:
+                server.quit()
+            except Exception:
+                pass
+        
+        return results
+    
+    def send_email(self, to_email: str, subject: str, body: str, html_body: str = None) -> bool:
+        """이메일 발송"""
+        return self.send_emails_bulk([(to_email, subject, body, html_body)])[0]
     
     def send_slack_notification(self, message: str, channel: str = None) -> bool:
         """슬랙 알림 발송"""
@@ -111,10 +167,11 @@ class NotificationSystem:
             if channel:
                 payload['channel'] = channel
             
-            response = requests.post(
+            response = self._http.post(
                 self.slack_webhook,
-                json=payload,
-                headers={'Content-Type': 'application/json'}
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=5
             )
             
             if response.status_code == 200:
@@ -174,91 +231,17 @@ class NotificationSystem:
         priority_text = "[긴급]" if priority == 'high' else ""
         subject = f"{priority_text} {person}님 - 공사 데이터 입력 요청 ({total_missing}건 누락)"
         
-        # 본문 (텍스트)
-        body = f"""
-안녕하세요 {person}님,
-
-공사 관리 시스템에서 다음과 같은 데이터 입력이 누락되어 있습니다.
-빠른 시일 내에 입력 부탁드립니다.
-
-총 누락 항목: {total_missing}건
-
-상세 내역:
-"""
-        
-        for field_info in critical_fields:
-            body += f"\n• {field_info['field']}: {field_info['count']}건 누락"
-            if field_info['projects']:
-                body += f"\n  - 해당 프로젝트: {', '.join(field_info['projects'][:3])}"
-                if len(field_info['projects']) > 3:
-                    body += f" 외 {len(field_info['projects']) - 3}건"
-        
-        body += f"""
-
-데이터 입력 완료 후 회신 부탁드립니다.
-
-감사합니다.
-냉난방기 설치 관리시스템
-발송시간: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}
-"""
-        
-        # HTML 본문
-        html_body = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{ font-family: 'Malgun Gothic', Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; }}
-        .container {{ max-width: 600px; margin: 0 auto; background: #f9f9f9; padding: 30px; border-radius: 10px; }}
-        .header {{ background: {'#dc3545' if priority == 'high' else '#667eea'}; color: white; padding: 20px; border-radius: 5px; text-align: center; margin-bottom: 20px; }}
-        .content {{ background: white; padding: 20px; border-radius: 5px; }}
-        .missing-item {{ background: #fff3cd; border: 1px solid #ffeaa7; padding: 10px; margin: 10px 0; border-radius: 5px; }}
-        .projects {{ font-size: 12px; color: #666; margin-left: 20px; }}
-        .footer {{ text-align: center; margin-top: 20px; font-size: 12px; color: #666; }}
-        .priority-high {{ color: #dc3545; font-weight: bold; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h2>{'🚨 긴급 데이터 입력 요청' if priority == 'high' else '📋 데이터 입력 요청'}</h2>
-        </div>
-        
-        <div class="content">
-            <h3>안녕하세요 {person}님,</h3>
-            <p>공사 관리 시스템에서 다음과 같은 데이터 입력이 누락되어 있습니다.</p>
-            <p><strong class="{'priority-high' if priority == 'high' else ''}">총 누락 항목: {total_missing}건</strong></p>
-            
-            <h4>상세 내역:</h4>
-"""
-        
-        for field_info in critical_fields:
-            html_body += f"""
-            <div class="missing-item">
-                <strong>• {field_info['field']}: {field_info['count']}건 누락</strong>
-"""
-            if field_info['projects']:
-                projects_text = ', '.join(field_info['projects'][:3])
-                if len(field_info['projects']) > 3:
-                    projects_text += f" 외 {len(field_info['projects']) - 3}건"
-                html_body += f'<div class="projects">해당 프로젝트: {projects_text}</div>'
-            
-            html_body += "</div>"
-        
-        html_body += f"""
-            <p style="margin-top: 20px;">데이터 입력 완료 후 회신 부탁드립니다.</p>
-            <p><strong>구글 시트 바로가기:</strong> <a href="https://docs.google.com/spreadsheets/d/{os.getenv('GOOGLE_SHEET_ID', '')}" target="_blank">여기를 클릭하세요</a></p>
-        </div>
-        
-        <div class="footer">
-            <p>냉난방기 설치 관리시스템<br>
-            발송시간: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        # 본문 (텍스트/HTML) - 미리 컴파일된 템플릿으로 렌더링
+        context = {
+            'person': person,
+            'total_missing': total_missing,
+            'critical_fields': critical_fields,
+            'priority': priority,
+            'sheet_id': os.getenv('GOOGLE_SHEET_ID', ''),
+            'sent_at': datetime.now().strftime('%Y년 %m월 %d일 %H:%M'),
+        }
+        body = _EMAIL_TEXT_TEMPLATE.render(context)
+        html_body = _EMAIL_HTML_TEMPLATE.render(context)
         
         return subject, body, html_body
     
@@ -274,21 +257,22 @@ class NotificationSystem:
             'total_notifications': len(notifications)
         }
         
+        messages = []
         for notification in notifications:
             person = notification['person']
             email = notification['email']
             
-            # 이메일 발송
             if email:
-                subject, body, html_body = self.generate_missing_data_email(notification)
-                if self.send_email(email, subject, body, html_body):
-                    results['email_sent'] += 1
-                else:
-                    results['email_failed'] += 1
+                messages.append((email, *self.generate_missing_data_email(notification)))
             else:
                 logger.warning(f"{person}님의 이메일 주소가 설정되지 않았습니다.")
                 results['email_failed'] += 1
         
+        # 이메일 발송 (SMTP 연결 하나로 일괄 발송)
+        sent = sum(self.send_emails_bulk(messages))
+        results['email_sent'] += sent
+        results['email_failed'] += len(messages) - sent
+        
         # 슬랙 요약 알림
         if notifications:
             slack_message = f"""
@@ -335,11 +319,11 @@ class NotificationSystem:
 발송시간: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}
 """
             
-            # 관리자들에게 발송
-            sent_count = 0
-            for admin_email in self.admin_emails:
-                if admin_email.strip() and self.send_email(admin_email.strip(), subject, body):
-                    sent_count += 1
+            # 관리자들에게 발송 (SMTP 연결 하나로 일괄 발송)
+            sent_count = sum(self.send_emails_bulk([
+                (admin_email.strip(), subject, body, None)
+                for admin_email in self.admin_emails if admin_email.strip()
+            ]))
             
             # 슬랙 알림
             slack_message = f"""
@@ -387,16 +371,24 @@ def run_notification_scheduler():
             
             analyzer = DataAnalyzer(df)
             
-            # 누락 데이터 분석
+            # 분석은 먼저 끝내고 (수천 행 규모라 수 ms), 발송(SMTP/슬랙 대기)만 겹쳐서 실행
             missing_analysis = analyzer.check_missing_data()
-            if missing_analysis:
-                results = notification_system.send_missing_data_notifications(missing_analysis)
-                logger.info(f"누락 데이터 알림 발송 결과: {results}")
-            
-            # 일일 요약 (관리자용)
             summary_stats = analyzer.get_summary_stats()
             outstanding_analysis = analyzer.get_outstanding_analysis()
-            notification_system.send_daily_summary(summary_stats, outstanding_analysis)
+            
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                # 누락 데이터 알림 (영업사원별)
+                missing_future = pool.submit(
+                    notification_system.send_missing_data_notifications, missing_analysis
+                ) if missing_analysis else None
+                # 일일 요약 (관리자용)
+                summary_future = pool.submit(
+                    notification_system.send_daily_summary, summary_stats, outstanding_analysis
+                )
+                
+                if missing_future is not None:
+                    logger.info(f"누락 데이터 알림 발송 결과: {missing_future.result()}")
+                summary_future.result()
             
             logger.info("일일 데이터 체크 완료")
             
@@ -411,7 +403,9 @@ def run_notification_scheduler():
     
     while True:
         schedule.run_pending()
-        time.sleep(60)  # 1분마다 체크
+        # 다음 작업 시각까지 잠듦 (시계 변경에 대비해 최대 1시간 단위로 다시 확인)
+        idle = schedule.idle_seconds()
+        time.sleep(min(max(idle, 1), 3600) if idle is not None else 60)
 
 if __name__ == "__main__":
     run_notification_scheduler()
\ No newline at end of file
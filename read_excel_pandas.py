@@ -1,12 +1,37 @@
+import os
 import pandas as pd
 import sys
 
 # UTF-8 출력 설정
 sys.stdout.reconfigure(encoding='utf-8')
 
+EXCEL_PATH = 'data/아이티 공사 현황 (2).xlsx'
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'  # 설치되어 있으면 Rust 파서로 엑셀 읽기
+except ImportError:
+    EXCEL_ENGINE = None
+
+def read_sheet(path, sheet_name):
+    """엑셀보다 최신인 parquet 캐시가 있으면 그것을, 없으면 엑셀을 읽고 캐시 저장"""
+    cache_path = path + '.parquet'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"parquet 캐시 읽기 실패, 엑셀로 대체: {e}")
+    
+    df = pd.read_excel(path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
+    try:
+        df.to_parquet(cache_path)
+    except Exception as e:
+        print(f"parquet 캐시 저장 실패: {e}")
+    return df
+
 try:
     # 엑셀 파일 읽기
-    df = pd.read_excel('data/아이티 공사 현황 (2).xlsx', sheet_name='공사 현황')
+    df = read_sheet(EXCEL_PATH, '공사 현황')
     
     print("=== 데이터 기본 정보 ===")
     print(f"데이터 크기: {df.shape[0]}행 x {df.shape[1]}열")
@@ -35,12 +60,11 @@ try:
     
     # 빈 값 체크
     print(f"\n=== 빈 값(결측치) 현황 ===")
-    null_counts = df.isnull().sum()
-    print(f"전체 빈 값 비율: {(null_counts.sum() / (df.shape[0] * df.shape[1]) * 100):.1f}%")
+    na = df.isna().to_numpy()
+    print(f"전체 빈 값 비율: {(na.mean() * 100 if na.size else 0):.1f}%")
     
-    # 주요 필드별 빈 값
-    for col in df.columns[:10]:  # 처음 10개 컬럼만
-        null_count = df[col].isnull().sum()
+    # 주요 필드별 빈 값 (처음 10개 컬럼만, 한 번에 집계)
+    for col, null_count in zip(df.columns[:10], na[:, :10].sum(axis=0)):
         if null_count > 0:
             print(f"  {col}: {null_count}개 ({null_count/len(df)*100:.1f}%)")
 
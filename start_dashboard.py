@@ -16,6 +16,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from dotenv import load_dotenv
 load_dotenv()
 
+# gevent/eventlet 서버 사용 시 소켓 I/O(구글 시트 호출 포함)가 서버를 막지 않도록 다른 모듈보다 먼저 패치
+async_mode = os.getenv('SOCKETIO_ASYNC_MODE', '').lower()
+if async_mode == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+elif async_mode == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 # 로깅 설정 개선
 log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
 logging.basicConfig(
@@ -98,12 +107,13 @@ def main():
     
     try:
         # 대시보드 앱 실행
-        from dashboard.app import app, socketio, load_data
+        from dashboard.app import app, socketio, load_data, start_background_refresh
         
         # 초기 데이터 로드
         logger.info("초기 데이터 로드 중...")
         if load_data() is None:
             logger.warning("초기 데이터 로드에 실패했지만 서버를 시작합니다.")
+        start_background_refresh()
         
         # 서버 설정
         host = os.getenv('HOST', '0.0.0.0')
@@ -5,74 +5,115 @@
 
 import os
 import sys
+import atexit
+import queue
 import logging
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-# 프로젝트 루트 경로 설정
-PROJECT_ROOT = Path(__file__).parent
-sys.path.insert(0, str(PROJECT_ROOT))
+# 프로젝트 루트 경로 설정 (스크립트로 실행하면 이미 sys.path[0]이므로 없을 때만 뒤에 추가)
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
-# 환경 변수 로드
+# 환경 변수 로드 (경로를 직접 지정해 호출 스택/상위 디렉터리 탐색 생략)
 from dotenv import load_dotenv
-load_dotenv()
+load_dotenv(os.path.join(PROJECT_ROOT, '.env'))
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('notifications.log', encoding='utf-8'),
+# 로그 포맷에서 쓰지 않는 스레드/프로세스/태스크 정보는 레코드마다 수집하지 않음
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+
+logger = logging.getLogger(__name__)
+_log_listener = None  # setup_logging()이 시작한 QueueListener (두 번 설정하지 않도록)
+
+def setup_logging():
+    """
+    로깅 설정 - 설정 검증을 통과한 뒤에만 호출 (실패 시 로그 파일을 열지 않음)
+    
+    로그 호출은 큐에 넣기만 하고, 파일/콘솔 쓰기는 QueueListener 스레드가 처리
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return  # 이미 설정됨 - 핸들러가 중복되면 같은 로그가 두 번 기록됨
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                                  datefmt='%Y-%m-%d %H:%M:%S')  # 밀리초 생략
+    handlers = [
+        # 10MB마다 교체, 최근 10개 보관 (delay: 첫 기록 때 파일 열기)
+        RotatingFileHandler('notifications.log', maxBytes=10 * 1024 * 1024, backupCount=10,
+                            encoding='utf-8', delay=True),
         logging.StreamHandler()
     ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # 종료 시 남은 로그까지 기록
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+# 필수/선택 설정 (환경 변수명, 설명)
+_REQUIRED_SETTINGS = (
+    ('GOOGLE_SHEET_ID', '구글 시트 ID'),
+    ('EMAIL_USERNAME', '이메일 계정'),
+    ('EMAIL_PASSWORD', '이메일 패스워드'),
+)
+_OPTIONAL_SETTINGS = (
+    ('SLACK_WEBHOOK_URL', '슬랙 웹훅'),
+    ('ADMIN_EMAILS', '관리자 이메일'),
+    ('SALES_EMAILS', '영업사원 이메일'),
 )
 
-logger = logging.getLogger(__name__)
+# 고정 안내 문구 (한 번의 출력으로)
+_BANNER = "📢 냉난방기 설치 공사 알림 시스템\n" + "=" * 60
+_START_BANNER = "\n".join([
+    "=" * 60,
+    "🚀 알림 시스템을 시작합니다...",
+    "📅 스케줄: 매일 오전 9시, 오후 6시 실행",
+    "🛑 종료하려면 Ctrl+C를 누르세요",
+    "=" * 60,
+])
 
 def main():
     """메인 함수"""
-    print("📢 냉난방기 설치 공사 알림 시스템")
-    print("=" * 60)
-    
-    # 설정 체크
-    required_settings = [
-        ('GOOGLE_SHEET_ID', '구글 시트 ID'),
-        ('EMAIL_USERNAME', '이메일 계정'),
-        ('EMAIL_PASSWORD', '이메일 패스워드')
-    ]
+    print(_BANNER)
     
+    # 설정 체크 (모아서 한 번에 출력)
+    env = os.environ
     missing_settings = []
-    for setting, description in required_settings:
-        if not os.getenv(setting):
+    lines = []
+    for setting, description in _REQUIRED_SETTINGS:
+        if not env.get(setting):
             missing_settings.append(f"❌ {setting} ({description})")
         else:
-            print(f"✅ {description} 설정됨")
+            lines.append(f"✅ {description} 설정됨")
+    if lines:
+        print("\n".join(lines))
     
     if missing_settings:
-        print("\n⚠️  다음 설정이 누락되었습니다:")
-        for setting in missing_settings:
-            print(f"   {setting}")
-        print("\n.env 파일을 확인하고 필요한 설정을 추가해주세요.")
-        sys.exit(1)
+        print("\n⚠️  다음 설정이 누락되었습니다:\n"
+              + "\n".join(f"   {setting}" for setting in missing_settings)
+              + "\n\n.env 파일을 확인하고 필요한 설정을 추가해주세요.")
+        # 로깅/스케줄러를 시작하기 전이라 정리할 것이 없음 → 출력만 비우고 인터프리터 종료 과정 생략
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
     
-    # 선택적 설정 체크
-    optional_settings = [
-        ('SLACK_WEBHOOK_URL', '슬랙 웹훅'),
-        ('ADMIN_EMAILS', '관리자 이메일'),
-        ('SALES_EMAILS', '영업사원 이메일')
-    ]
+    setup_logging()
     
-    print("\n선택적 설정:")
-    for setting, description in optional_settings:
-        if os.getenv(setting):
-            print(f"✅ {description} 설정됨")
-        else:
-            print(f"⚠️  {description} 설정 안됨 (선택사항)")
+    # 선택적 설정 체크
+    print("\n선택적 설정:\n" + "\n".join(
+        f"✅ {description} 설정됨" if env.get(setting) else f"⚠️  {description} 설정 안됨 (선택사항)"
+        for setting, description in _OPTIONAL_SETTINGS
+    ))
     
-    print("=" * 60)
-    print("🚀 알림 시스템을 시작합니다...")
-    print("📅 스케줄: 매일 오전 9시, 오후 6시 실행")
-    print("🛑 종료하려면 Ctrl+C를 누르세요")
-    print("=" * 60)
+    print(_START_BANNER)
     
     try:
         # 알림 스케줄러 실행